@@ -1,7 +1,9 @@
 import datetime
+import codecs
 import struct
 import sys
 import time
+from calendar import timegm
 import Parameter
 import Command
 import PhaData
@@ -18,16 +20,242 @@ import DigitalOscilloscopeData
 from TypeCode import TypeCode
 from Exceptions import SerializationException
 from MetaData import MetaData
+from Serializable import Serializable
 from SerializableObject import SerializableObject
+try:
+    import numpy
+except ImportError:
+    # numpy is optional.  Arrays are packed with struct without it
+    numpy = None
 
-if sys.version_info >= (3, 0):
+_PY3 = sys.version_info >= (3, 0)
+if _PY3:
     long = int
 
+#Date conversion constants
+_FILETIME_NULL = datetime.datetime(1601, 1, 1, 0, 0, 0)
+_TZ_OFFSET = datetime.timedelta(seconds=time.timezone)
+_EPOCH_AS_FILETIME = 116444736000000000  # January 1, 1970 as MS file time
+_HUNDREDS_OF_NANOSECONDS = 10000000
+_TZ_OFFSET_US = (_TZ_OFFSET.days*86400 + _TZ_OFFSET.seconds)*1000000
+
+if _PY3:
+    _UTC = datetime.timezone.utc
+else:
+    class _UTCZone(datetime.tzinfo):
+        """UTC"""
+        def utcoffset(self, dt):
+            return datetime.timedelta(0)
+
+        def tzname(self, dt):
+            return "UTC"
+
+        def dst(self, dt):
+            return datetime.timedelta(0)
+    _UTC = _UTCZone()
+
+#Strings are always utf-16 little endian on the wire
+_UTF16LE_ENCODE = codecs.getencoder('utf_16_le')
+_UTF16LE_DECODE = codecs.getdecoder('utf_16_le')
+
+#Precompiled formats for the fixed size (little endian) wire types
+_S_B = struct.Struct("B")
+_S_b = struct.Struct("b")
+_S_h = struct.Struct("<h")
+_S_H = struct.Struct("<H")
+_S_i = struct.Struct("<i")
+_S_I = struct.Struct("<I")
+_S_q = struct.Struct("<q")
+_S_Q = struct.Struct("<Q")
+_S_f = struct.Struct("<f")
+_S_d = struct.Struct("<d")
+_S_bool = struct.Struct("?")
+_S_ii = struct.Struct("<ii")
+
+#Unsigned values are truncated to their wire width by masking
+def _packUint(obj):
+    return _S_I.pack(obj & 0xFFFFFFFF)
+
+def _packUlong(obj):
+    return _S_Q.pack(obj & 0xFFFFFFFFFFFFFFFF)
+
+#Type codes whose packing is selected by the objTypeCode argument
+#of ApplicationSerializer.serialize
+_PACKERS = {
+    TypeCode.Short: _S_h.pack,
+    TypeCode.Ushort: _S_h.pack,
+    TypeCode.Uint: _packUint,
+    TypeCode.Long: _packUlong,
+    TypeCode.Ulong: _packUlong,
+    TypeCode.Float: _S_f.pack,
+}
+
+#Fixed size type codes: (bound unpack_from of the precompiled
+#format, size in bytes).  Binding the method here saves an
+#attribute lookup for every field that is read
+_UNPACKERS = {
+    TypeCode.Int: (_S_i.unpack_from, 4),
+    TypeCode.Uint: (_S_I.unpack_from, 4),
+    TypeCode.Long: (_S_q.unpack_from, 8),
+    TypeCode.Ulong: (_S_Q.unpack_from, 8),
+    TypeCode.Short: (_S_h.unpack_from, 2),
+    TypeCode.Ushort: (_S_H.unpack_from, 2),
+    TypeCode.Byte: (_S_b.unpack_from, 1),
+    TypeCode.Ubyte: (_S_B.unpack_from, 1),
+    TypeCode.Float: (_S_f.unpack_from, 4),
+    TypeCode.Double: (_S_d.unpack_from, 8),
+    TypeCode.Bool: (_S_bool.unpack_from, 1),
+}
+
+#The wire is little endian.  numpy arrays are swapped on big endian hosts
+_BIG_ENDIAN_HOST = ('big' == sys.byteorder)
+
+#Struct format characters for arrays of a fixed size wire type
+_ARRAY_FORMATS = {
+    TypeCode.Int: 'i',
+    TypeCode.Uint: 'I',
+    TypeCode.Long: 'q',
+    TypeCode.Ulong: 'Q',
+    TypeCode.Short: 'h',
+    TypeCode.Ushort: 'H',
+    TypeCode.Byte: 'b',
+    TypeCode.Ubyte: 'B',
+    TypeCode.Float: 'f',
+    TypeCode.Double: 'd',
+}
+
+#Compiled array formats keyed by (count, format).  Array
+#lengths rarely change within a session (channels, counters), so the
+#dictionary stays small; it is cleared if it ever grows past the limit
+_ARRAY_STRUCTS = {}
+_ARRAY_STRUCTS_MAX = 128
+
+def _getArrayStruct(count, fmt):
+    """
+    Description:
+        Returns the compiled little endian format for
+        an array of count values or count groups of values
+    Arguments:
+        count    (in, int) The number of values or groups
+        fmt      (in, str) The struct format character, or the
+                 format characters of one group
+    Returns:
+        (struct.Struct) The compiled format
+    """
+    key = (count, fmt)
+    compiled = _ARRAY_STRUCTS.get(key)
+    if (None == compiled):
+        if (len(_ARRAY_STRUCTS) >= _ARRAY_STRUCTS_MAX):
+            _ARRAY_STRUCTS.clear()
+        if (1 == len(fmt)):
+            compiled = struct.Struct('<%d%s' % (count, fmt))
+        else:
+            compiled = struct.Struct('<' + fmt * count)
+        _ARRAY_STRUCTS[key] = compiled
+    return compiled
+
+def _coerceIntegers(seq, fmt):
+    """
+    Description:
+        Converts array values that struct rejected into ints.  Values
+        for unsigned types are masked to their width like serialize()
+        does, so negative values wrap instead of failing
+    Arguments:
+        seq    (in, sequence) The values
+        fmt    (in, string) The struct format character
+    Exceptions:
+        struct.error    The values are not integers
+    Returns:
+        (int[]) The values
+    """
+    if (fmt in 'fd'):
+        raise struct.error('required argument is not a float')
+    if (fmt.isupper()):
+        mask = (1 << (8 * struct.calcsize(fmt))) - 1
+        return [int(v) & mask for v in seq]
+    return [int(v) for v in seq]
+
+#Custom type codes mapped to the SerializableObject class that
+#deserializes them.  This is filled on first use because those
+#modules import this one
+_CLASS_TYPES = {}
+
+def _getClassTypes():
+    if (0 == len(_CLASS_TYPES)):
+        _CLASS_TYPES.update({
+            TypeCode.SCAdefinitionData: SCAdefinitions.SCAdefinitions,
+            TypeCode.SCAbufferData: SCAbuffer.SCAbuffer,
+            TypeCode.CommandData: Command.Command,
+            TypeCode.ParameterData: Parameter.Parameter,
+            TypeCode.PhaData: PhaData.PhaData,
+            TypeCode.McsData: McsData.McsData,
+            TypeCode.DlfcData: DlfcData.DlfcData,
+            TypeCode.CounterData: CounterData.CounterData,
+            TypeCode.RegionOfInterestData: RegionOfInterest.RegionOfInterest,
+            TypeCode.ParameterMetaData: ParameterAttributes.ParameterAttributes,
+            TypeCode.ListData: ListData.ListData,
+            TypeCode.TlistData: ListData.TlistData,
+            TypeCode.SpectralData: Spectrum.Spectrum,
+            TypeCode.DsoData: DigitalOscilloscopeData.DigitalOscilloscopeData,
+        })
+    return _CLASS_TYPES
+
 class Uint64(object):
     def __init__(self, val):
         self.value = long(val)
         self.uint64 = True
 
+#Type code and size handlers keyed by the exact class of the data. The
+#ordered handler lists are only walked the first time a new class is seen
+_TYPECODE_HANDLERS = [
+    (bool, lambda obj: TypeCode.Bool),
+    (int, lambda obj: TypeCode.Uint),
+    (float, lambda obj: TypeCode.Double),
+    (str, lambda obj: TypeCode.String),
+    (datetime.datetime, lambda obj: TypeCode.DateTime),
+    (SerializableObject, lambda obj: obj.getType()),
+    (Uint64, lambda obj: TypeCode.Long),
+]
+_TYPESIZE_HANDLERS = [
+    (bool, lambda obj: 1),
+    (int, lambda obj: 4),
+    (float, lambda obj: 8),
+    (str, lambda obj: len(_UTF16LE_ENCODE(obj)[0])),
+    (datetime.datetime, lambda obj: 8),
+    (SerializableObject, lambda obj: int(obj.getSize())),
+    (Uint64, lambda obj: 8),
+]
+if (_PY3 is False):
+    _TYPECODE_HANDLERS.append((long, lambda obj: TypeCode.Long))
+    _TYPESIZE_HANDLERS.append((long, lambda obj: 8))
+
+_TYPECODE_TABLE = {type(None): lambda obj: TypeCode.Null}
+_TYPESIZE_TABLE = {type(None): lambda obj: 0}
+for (cls, handler) in _TYPECODE_HANDLERS:
+    _TYPECODE_TABLE.setdefault(cls, handler)
+for (cls, handler) in _TYPESIZE_HANDLERS:
+    _TYPESIZE_TABLE.setdefault(cls, handler)
+
+def _lookupTypeHandler(obj, table, handlers):
+    """
+    Description:
+        Finds the handler for a class that is not in the
+        table yet and caches it for the next lookup
+    Arguments:
+        obj       (in, any)  The data
+        table     (in, out, dict) The class to handler cache
+        handlers  (in, list) The ordered (class, handler) list
+    Exceptions:
+        SerializationException.
+    Returns:
+        (callable) The handler
+    """
+    for (cls, handler) in handlers:
+        if (isinstance(obj, cls)):
+            table[type(obj)] = handler
+            return handler
+    raise SerializationException("Type not supported: %s" % type(obj))
+
 def convertToLocalDate(val):
     """
     Description:
@@ -38,16 +266,83 @@ def convertToLocalDate(val):
     Returns:
         (datetime) The converted value
     """
-    _FILETIME_null_date = datetime.datetime(1601, 1, 1, 0, 0, 0)
-    import sys
-    if sys.version_info >= (3, 0):
-        timestamp = int(val)
-    else:
-        timestamp = long(val)
-    val= _FILETIME_null_date + datetime.timedelta(microseconds=timestamp/10) - datetime.timedelta(seconds=time.timezone)
+    return _FILETIME_NULL + datetime.timedelta(microseconds=long(val)/10) - _TZ_OFFSET
     #if (1==time.daylight):
     #    val += datetime.timedelta(seconds=3600)
-    return val
+
+
+def convertToLocalDateArray(vals, useNumpy=False):
+    """
+    Description:
+        This method will convert a sequence of Win32 FILETIME
+        values received from the lynx into localized date/times.
+        With numpy the values are converted as one array and are
+        rounded exactly as convertToLocalDate rounds them
+    Arguments:
+        vals      (in, sequence or numpy.ndarray) The values to convert
+        useNumpy  (in, optional, bool) Return a numpy datetime64[us]
+                  array when numpy is installed
+    Returns:
+        (datetime[] or numpy.ndarray) The converted values
+    """
+    if (None == numpy):
+        return [convertToLocalDate(val) for val in vals]
+    ft = numpy.asarray(vals).astype(numpy.int64)
+    if (_PY3 is False):
+        #long/int is floor division on Python 2
+        us = ft // 10
+    else:
+        us = _roundFiletimeToMicroseconds(ft)
+    us -= _EPOCH_AS_FILETIME // 10 + _TZ_OFFSET_US
+    dates = us.astype('datetime64[us]')
+    if (useNumpy):
+        return dates
+    return dates.tolist()
+
+def _roundFiletimeToMicroseconds(ft):
+    """
+    Description:
+        Divides FILETIME values by 10 the way timedelta(microseconds=val/10)
+        does on Python 3.  The quotient is first rounded to the nearest
+        double and that is then rounded half to even, both with integer
+        arithmetic so no precision is lost on the way
+    Arguments:
+        ft    (in, numpy.ndarray) The int64 FILETIME values
+    Returns:
+        (numpy.ndarray) The int64 microseconds
+    """
+    mag = numpy.abs(ft)
+    q = mag // 10
+    #Exponent of the quotient and so the spacing of the doubles around it
+    e = numpy.zeros(mag.shape, numpy.int64)
+    bits = q.copy()
+    for shift in (32, 16, 8, 4, 2, 1):
+        big = (bits >> shift) > 0
+        e += numpy.where(big, shift, 0)
+        bits = numpy.where(big, bits >> shift, bits)
+    s = 52 - e
+    one = numpy.int64(1)
+    #Quotients below 2**53 are exact multiples of 2**-s
+    fine = s >= 0
+    sf = numpy.where(fine, s, 0)
+    n = mag << sf
+    m = n // 10
+    r = n - m*10
+    m += (r > 5) | ((r == 5) & ((m & 1) == 1))
+    half = numpy.where(sf > 0, one << numpy.maximum(sf - 1, 0), 0)
+    p = m >> sf
+    rem = m - (p << sf)
+    p += (sf > 0) & ((rem > half) | ((rem == half) & ((p & 1) == 1)))
+    #Larger quotients are rounded to a multiple of 2**-s
+    sc = numpy.where(fine, 0, -s)
+    d = (one << sc)*10
+    c = mag // d
+    rc = mag - c*d
+    c += (2*rc > d) | ((2*rc == d) & ((c & 1) == 1))
+    us = numpy.where(fine, p, c << sc)
+    #Values below 10 are below 1 microsecond and only 6 to 9 round up
+    us = numpy.where(q == 0, mag > 5, us)
+    return numpy.where(ft < 0, -us, us)
 
 
 def convertToLynxDate(dt):
@@ -59,33 +354,9 @@ def convertToLynxDate(dt):
     Returns:
         (long) The converted value
     """
-    from datetime import datetime, timedelta, tzinfo
-    from calendar import timegm
-
-
-    ZERO = timedelta(0)
-    HOUR = timedelta(hours=1)
-
-
-    class UTC(tzinfo):
-        """UTC"""
-        def utcoffset(self, dt):
-            return ZERO
-
-        def tzname(self, dt):
-            return "UTC"
-
-        def dst(self, dt):
-            return ZERO
-
-
-    utc = UTC()
-    EPOCH_AS_FILETIME = 116444736000000000  # January 1, 1970 as MS file time
-    HUNDREDS_OF_NANOSECONDS = 10000000
-
     if (dt.tzinfo is None) or (dt.tzinfo.utcoffset(dt) is None):
-        dt = dt.replace(tzinfo=utc)
-    ft = EPOCH_AS_FILETIME + (timegm(dt.timetuple()) * HUNDREDS_OF_NANOSECONDS)
+        dt = dt.replace(tzinfo=_UTC)
+    ft = _EPOCH_AS_FILETIME + (timegm(dt.timetuple()) * _HUNDREDS_OF_NANOSECONDS)
     return ft + (dt.microsecond * 10)
 
                         
@@ -110,31 +381,28 @@ class ApplicationSerializer:
         Return:
             int    The type code see TypeCode class
         """
-        if (None == obj):
-            return TypeCode.Null
-        elif(isinstance(obj, bool)):
-            return TypeCode.Bool
-        elif (isinstance(obj, int)) :
-            return TypeCode.Uint
-        elif(isinstance(obj, float)):
-            return TypeCode.Double        
-        elif(isinstance(obj, str)):
-            return TypeCode.String
-        elif(isinstance(obj, datetime.datetime)):
-            return TypeCode.DateTime
-        elif(isinstance(obj, SerializableObject)):
-            return obj.getType()
-        elif(hasattr(obj, 'uint64')):
-            return TypeCode.Long
-        elif(hasattr(obj, 'getType')):
-            return obj.getType()
-        else:
-            if sys.version_info < (3, 0):
-                if isinstance(obj, long):
-                    return TypeCode.Long
-
-            raise SerializationException("Type not supported: %s" % type(obj))
+        getCode = _TYPECODE_TABLE.get(type(obj))
+        if (None == getCode):
+            getCode = _lookupTypeHandler(obj, _TYPECODE_TABLE, _TYPECODE_HANDLERS)
+        return getCode(obj)
     getTypeCode = staticmethod(getTypeCode)
+
+    def validateType(obj):
+        """
+        Description:
+            Verifies the argument is a type that can be serialized.
+            Only the class is checked so known classes cost a single
+            dict lookup
+        Arguments:
+            obj    (in, any)    The data
+        Exceptions:
+            SerializationException.
+        Return:
+            none
+        """
+        if (type(obj) not in _TYPECODE_TABLE):
+            _lookupTypeHandler(obj, _TYPECODE_TABLE, _TYPECODE_HANDLERS)
+    validateType = staticmethod(validateType)
     
     def getTypeSize(obj):
         """
@@ -148,40 +416,24 @@ class ApplicationSerializer:
         Return:
             int    The size in bytes
         """
-        if (None == obj):
-            return 0
-        elif(isinstance(obj, bool)):
-            return 1
-        elif (isinstance(obj, int)) :
-            return 4
-        elif(isinstance(obj, float)):
-            return 8        
-        elif(isinstance(obj, str)):
-            return len(obj.encode('utf_16_le'))
-        elif(isinstance(obj, datetime.datetime)):
-            return 8
-        elif(isinstance(obj, SerializableObject)):
-            return int(obj.getSize())
-        elif(hasattr(obj, 'uint64')):
-            return 8
-        elif(hasattr(obj, 'getSize')):
-            return obj.getSize()
-        else:
-            if sys.version_info < (3, 0):
-                if isinstance(obj, long):
-                    return 8
-            raise SerializationException('Type not supported: %s'%type(obj))
+        getSize = _TYPESIZE_TABLE.get(type(obj))
+        if (None == getSize):
+            getSize = _lookupTypeHandler(obj, _TYPESIZE_TABLE, _TYPESIZE_HANDLERS)
+        return getSize(obj)
         
     getTypeSize = staticmethod(getTypeSize)
     
-    def serialize(obj, stream=b'', writeMeta=False, objTypeCode=None):
+    def serialize(obj, stream=None, writeMeta=False, objTypeCode=None):
         """
         History:
             This method serializes the data contained
             in this instance into the stream
         Arguments:
             obj         (in, any) The data to serialize
-            stream      (in, char[]) The stream to append to
+            stream      (in, out, bytearray) The stream to append to.  This is
+                        optional.  If not supplied, a new stream is created.
+                        The data is appended in place so nested objects
+                        do not copy the stream that has already been written
             writeMeta   (in, bool) Flag to indicate metadata should be written
                         before the data value is written.  This is optional.
                         If not supplied, no metadata is written
@@ -191,58 +443,56 @@ class ApplicationSerializer:
         Exceptions:
             SerializationException.
         Return:
-            stream    (char []) The stream containing the information plus
-                                the additional stream data specified as via
-                                the method argument='stream'
+            stream    (bytearray) The stream containing the information plus
+                                  the additional stream data specified as via
+                                  the method argument='stream'
         """        
+        if (None == stream):
+            stream = bytearray()
+        elif (isinstance(stream, bytearray) is False):
+            stream = bytearray(stream)
+        if (isinstance(obj, str)):
+            #Encode once; the length is needed for the meta data or the prefix
+            encoded = _UTF16LE_ENCODE(obj)[0]
+            if (writeMeta):
+                stream += _S_i.pack(TypeCode.String)
+            stream += _S_i.pack(len(encoded))
+            stream += encoded
+            return stream
         if (writeMeta):
             metaData = MetaData(ApplicationSerializer.getTypeCode(obj), ApplicationSerializer.getTypeSize(obj))
-            stream += metaData.serialize()
+            stream = metaData.serialize(stream)
             
+        pack = _PACKERS.get(objTypeCode)
         if (None == obj): pass
         elif(isinstance(obj, bool) or (objTypeCode == TypeCode.Bool)):
-            if (obj is True) :
-                stream += struct.pack("B", 1)
-            else:
-                stream += struct.pack("B", 0)
-        elif ((objTypeCode == TypeCode.Byte)) :
-            stream += struct.pack("b", obj)
-        elif ((objTypeCode == TypeCode.Ubyte)) :
-            stream += struct.pack("B", obj)
-        elif ((objTypeCode == TypeCode.Short) or (objTypeCode == TypeCode.Ushort)) :
-            stream += struct.pack("<h", obj)
-        elif objTypeCode == TypeCode.Uint :
-            import ctypes
-            stream += struct.pack("<I", ctypes.c_uint32(obj).value)
-        elif((objTypeCode == TypeCode.Long) or (objTypeCode == TypeCode.Ulong)):
-            import ctypes
-            stream += struct.pack("<q", ctypes.c_uint64(obj).value)
-        elif(objTypeCode == TypeCode.Float):
-            stream += struct.pack("<f", obj)    
+            stream.append(1 if obj else 0)
+        elif((objTypeCode == TypeCode.Byte) or (objTypeCode == TypeCode.Ubyte)):
+            stream.append(obj & 0xFF)
+        elif (None != pack):
+            stream += pack(obj)
         elif (isinstance(obj, int) or (objTypeCode == TypeCode.Int)):
-            stream += struct.pack("<i", obj)
-        elif(hasattr(obj, 'uint64')):
-            stream += struct.pack("<q", obj.value)
+            stream += _S_i.pack(obj)
+        elif(isinstance(obj, Uint64)):
+            stream += _S_q.pack(obj.value)
         elif(isinstance(obj, float) or (objTypeCode == TypeCode.Double)):
-            stream += struct.pack("<d", obj)        
+            stream += _S_d.pack(obj)        
         elif(isinstance(obj, str) or (objTypeCode == TypeCode.String)):
+            encoded = _UTF16LE_ENCODE(obj)[0]
             if (writeMeta is False):
-                length = len(obj.encode('utf_16_le'))
-                stream += struct.pack("<i", length)            
-            stream += obj.encode('utf_16_le')
+                stream += _S_i.pack(len(encoded))
+            stream += encoded
             #stream += struct.pack("%ds"%length, obj.encode('utf-16'))
         elif(isinstance(obj, datetime.datetime) or (objTypeCode == TypeCode.DateTime)):
             tmp = convertToLynxDate(obj)
-            stream += struct.pack("<q", tmp)
-        elif(isinstance(obj, SerializableObject)):
-            stream += obj.serialize()
-        elif(hasattr(obj, 'serialize')):
-            stream += obj.serialize()
+            stream += _S_q.pack(tmp)
+        elif(isinstance(obj, Serializable)):
+            stream = obj.serialize(stream)
         elif(TypeCode.Null == type): pass  
         else:
-            if sys.version_info < (3, 0):
+            if (_PY3 is False):
                 if isinstance(obj, long):
-                    stream += struct.pack("<q", obj)
+                    stream += _S_q.pack(obj)
                     return stream
 
             raise SerializationException('Type not supported: %s'%type(obj))          
@@ -261,111 +511,191 @@ class ApplicationSerializer:
         Exceptions:
             SerializationException.
         Return:
-            [any, char[]] [The deserialized instance, The stream minus the deserialized data]
+            [any, memoryview] [The deserialized instance, The stream minus the deserialized data]
         """
-        if (TypeCode.Int == type):
-            data=struct.unpack("<i", stream[0:4])[0]
-            stream = stream[4:]            
-        elif(TypeCode.Uint == type):
-            data=struct.unpack("<I", stream[0:4])[0]
-            stream = stream[4:]  
-        elif(TypeCode.Long == type):
-            data = struct.unpack("<q", stream[0:8])[0]
-            stream = stream[8:]  
-        elif(TypeCode.Ulong == type):
-            data = struct.unpack("<Q", stream[0:8])[0]
-            stream = stream[8:]  
-        elif(TypeCode.Short == type):
-            data = struct.unpack("<h", stream[0:2])[0]
-            stream = stream[2:]   
-        elif(TypeCode.Ushort == type):
-            data = struct.unpack("<H", stream[0:2])[0]
-            stream = stream[2:]   
-        elif (TypeCode.Byte == type) :
-            data = struct.unpack("<b", stream[0:1])[0]
-            stream = stream[1:] 
-        elif (TypeCode.Ubyte == type) :
-            data = struct.unpack("<B", stream[0:1])[0]
-            stream = stream[1:]   
-        elif(TypeCode.Float == type):
-            data = struct.unpack("<f", stream[0:4])[0]
-            stream = stream[4:]    
-        elif(TypeCode.Double == type):
-            data = struct.unpack("<d", stream[0:8])[0]
-            stream = stream[8:]         
-        elif(TypeCode.Bool == type):
-            data = struct.unpack('<B', stream[0:1])[0]
-            if (0 == data):
-                data = False
-            else:
-                data = True
-            stream = stream[1:]
+        stream = memoryview(stream)
+        [data, offset] = ApplicationSerializer.deserializeFrom(stream, 0, type, size)
+        return [data, stream[offset:]]
+    deserialize = staticmethod(deserialize)
+
+    def deserializeFrom(stream, offset, type=TypeCode.Unknown, size=0):
+        """
+        History:
+            This method deserializes the data contained in the stream
+            starting at the offset and returns it to the user.  The
+            stream is never sliced or copied, the offset is advanced
+            instead
+        Arguments:                    
+            stream    (in, memoryview) The stream containing the data
+            offset    (in, int) The offset of the data within the stream
+            type      (in, int) The data type.  See TypeCode class
+            size      (in, optional, int) The size of the data. Used only for strings
+        Exceptions:
+            SerializationException.
+        Return:
+            [any, int] [The deserialized instance, The offset following the deserialized data]
+        """
+        while (TypeCode.Unknown == type):
+            #Punt and assume there is metadata in the stream
+            [type, size] = _S_ii.unpack_from(stream, offset)
+            offset += 8
+        unpacker = _UNPACKERS.get(type)
+        if (None != unpacker):
+            data = unpacker[0](stream, offset)[0]
+            return [data, offset + unpacker[1]]
+        cls = _getClassTypes().get(type)
+        if (None != cls):
+            data = cls()
+            offset = data.deserializeFrom(stream, offset)
         elif(TypeCode.Null == type):            
             data = None
         elif(TypeCode.String == type):
             if (size > 0):
                 length = size
             else:
-                length = struct.unpack("<i", stream[0:4])[0]
-                stream = stream[4:]
-            data = stream[0:length]
-            data = data.decode('utf-16')
-            stream = stream[length:]
+                length = _S_i.unpack_from(stream, offset)[0]
+                offset += 4
+            data = _UTF16LE_DECODE(stream[offset:offset+length])[0]
+            offset += length
         elif(TypeCode.DateTime == type):
-            ft = struct.unpack("<q", stream[0:8]) 
+            ft = _S_q.unpack_from(stream, offset)
             data = convertToLocalDate(ft[0])
-            stream = stream[8:]  
-        elif(TypeCode.SCAdefinitionData == type):
-            data = SCAdefinitions.SCAdefinitions()
-            stream = data.deserialize(stream)
-        elif(TypeCode.SCAbufferData == type):
-            data = SCAbuffer.SCAbuffer()
-            stream = data.deserialize(stream)
-        elif(TypeCode.CommandData == type):
-            data = Command.Command()
-            stream = data.deserialize(stream)
-        elif(TypeCode.ParameterData == type):
-            data = Parameter.Parameter()
-            stream = data.deserialize(stream)
-        elif(TypeCode.PhaData == type):
-            data = PhaData.PhaData()
-            stream = data.deserialize(stream)
-        elif(TypeCode.McsData == type):
-            data = McsData.McsData()
-            stream = data.deserialize(stream)
-        elif(TypeCode.DlfcData == type):
-            data = DlfcData.DlfcData()
-            stream = data.deserialize(stream)
-        elif(TypeCode.CounterData == type):
-            data = CounterData.CounterData()
-            stream = data.deserialize(stream)
-        elif(TypeCode.RegionOfInterestData == type):
-            data = RegionOfInterest.RegionOfInterest()
-            stream = data.deserialize(stream)
-        elif(TypeCode.ParameterMetaData == type):
-            data = ParameterAttributes.ParameterAttributes()
-            stream = data.deserialize(stream)
-        elif(TypeCode.ListData == type):
-            data = ListData.ListData()
-            stream = data.deserialize(stream)
-        elif(TypeCode.TlistData == type):
-            data = ListData.TlistData()
-            stream = data.deserialize(stream)
-        elif(TypeCode.SpectralData == type):
-            data = Spectrum.Spectrum()
-            stream = data.deserialize(stream)
-        elif(TypeCode.DsoData == type):
-            data = DigitalOscilloscopeData.DigitalOscilloscopeData()
-            stream = data.deserialize(stream)
-        elif(TypeCode.Unknown == type):
-            #Punt and assume there is metadata in the stream
-            metaData = MetaData()
-            stream = metaData.deserialize(stream)
-            return ApplicationSerializer.deserialize(stream, metaData.getDataType(), metaData.getDataSize())
+            offset += 8
         elif(TypeCode.Blob == type):
             # This is a BLOB
-            return [stream, stream]
+            return [bytes(stream[offset:]), offset]
         else:
             raise SerializationException('Type not supported, Canberra Type Code: %d'%type)
-        return [data, stream]
-    deserialize = staticmethod(deserialize)
+        return [data, offset]
+    deserializeFrom = staticmethod(deserializeFrom)
+
+    def serializeArray(stream, typeCode, seq):
+        """
+        Description:
+            Serializes a sequence of values of a single fixed
+            size type with one pack call.  No meta data or
+            count is written
+        Arguments:
+            stream    (in, out, bytearray) The stream to append to
+            typeCode  (in, int) The element type.  See TypeCode class
+            seq       (in, sequence or numpy.ndarray) The values
+        Exceptions:
+            SerializationException.
+        Returns:
+            bytearray    The stream containing the results
+        """
+        fmt = _ARRAY_FORMATS.get(typeCode)
+        if (None == fmt):
+            raise SerializationException('Array type not supported, Canberra Type Code: %d'%typeCode)
+        if (None == stream):
+            stream = bytearray()
+        if ((None != numpy) and isinstance(seq, numpy.ndarray)):
+            stream += seq.astype('<' + fmt, copy=False).tobytes()
+            return stream
+        compiled = _getArrayStruct(len(seq), fmt)
+        try:
+            stream += compiled.pack(*seq)
+        except struct.error:
+            stream += compiled.pack(*_coerceIntegers(seq, fmt))
+        return stream
+    serializeArray = staticmethod(serializeArray)
+
+    def serializeArrayWithMeta(stream, typeCode, seq, fmt=None):
+        """
+        Description:
+            Serializes a sequence of values of a single fixed size
+            type as consecutive meta data wrapped values, which is how
+            command arguments are written, using one pack call
+        Arguments:
+            stream    (in, out, bytearray) The stream to append to
+            typeCode  (in, int) The element type.  See TypeCode class
+            seq       (in, sequence or numpy.ndarray) The values
+            fmt       (in, optional, string) The struct format character
+                      of the values.  Defaults to the format of typeCode
+        Exceptions:
+            SerializationException.
+        Returns:
+            bytearray    The stream containing the results
+        """
+        if (None == fmt):
+            fmt = _ARRAY_FORMATS.get(typeCode)
+        if (None == fmt):
+            raise SerializationException('Array type not supported, Canberra Type Code: %d'%typeCode)
+        if (None == stream):
+            stream = bytearray()
+        size = struct.calcsize('<' + fmt)
+        count = len(seq)
+        if ((None != numpy) and isinstance(seq, numpy.ndarray)):
+            rec = numpy.empty(count, dtype=[('type', '<i4'), ('size', '<i4'), ('value', '<' + fmt)])
+            rec['type'] = typeCode
+            rec['size'] = size
+            rec['value'] = seq
+            stream += rec.tobytes()
+            return stream
+        #Interleave (type, size, value) with slice assignment
+        vals = [typeCode] * (3 * count)
+        vals[1::3] = [size] * count
+        vals[2::3] = seq
+        compiled = _getArrayStruct(count, 'ii' + fmt)
+        try:
+            stream += compiled.pack(*vals)
+        except struct.error:
+            vals[2::3] = _coerceIntegers(seq, fmt)
+            stream += compiled.pack(*vals)
+        return stream
+    serializeArrayWithMeta = staticmethod(serializeArrayWithMeta)
+
+    def deserializeArray(stream, typeCode, count, useNumpy=False):
+        """
+        Description:
+            Deserializes count values of a single fixed size
+            type with one unpack call
+        Arguments:
+            stream    (in, char[]) The stream to read from
+            typeCode  (in, int) The element type.  See TypeCode class
+            count     (in, int) The number of values
+            useNumpy  (in, optional, bool) Return a numpy array viewing
+                      the stream when numpy is installed
+        Exceptions:
+            SerializationException.
+        Returns:
+            [list or numpy.ndarray, char[]]    The values and the stream
+                                               minus the deserialized data
+        """
+        stream = memoryview(stream)
+        [data, offset] = ApplicationSerializer.deserializeArrayFrom(stream, 0, typeCode, count, useNumpy)
+        return [data, stream[offset:]]
+    deserializeArray = staticmethod(deserializeArray)
+
+    def deserializeArrayFrom(stream, offset, typeCode, count, useNumpy=False):
+        """
+        Description:
+            Deserializes count values of a single fixed size type,
+            starting at the offset, with one unpack call.  The
+            stream is not sliced
+        Arguments:
+            stream    (in, memoryview) The stream containing the data
+            offset    (in, int) The offset of the data within the stream
+            typeCode  (in, int) The element type.  See TypeCode class
+            count     (in, int) The number of values
+            useNumpy  (in, optional, bool) Return a numpy array viewing
+                      the stream when numpy is installed
+        Exceptions:
+            SerializationException.
+        Returns:
+            [list or numpy.ndarray, int]    The values and the offset
+                                            following the deserialized data
+        """
+        fmt = _ARRAY_FORMATS.get(typeCode)
+        if (None == fmt):
+            raise SerializationException('Array type not supported, Canberra Type Code: %d'%typeCode)
+        compiled = _getArrayStruct(count, fmt)
+        if (useNumpy and (None != numpy)):
+            data = numpy.frombuffer(stream, '<' + fmt, count, offset)
+            if (_BIG_ENDIAN_HOST):
+                #Swap once so later arithmetic uses the native byte order
+                data = data.astype('=' + fmt)
+        else:
+            data = list(compiled.unpack_from(stream, offset))
+        return [data, offset + compiled.size]
+    deserializeArrayFrom = staticmethod(deserializeArrayFrom)
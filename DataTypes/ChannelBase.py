@@ -1,7 +1,30 @@
 from socket import *
 import select
+try:
+    import selectors
+except ImportError:
+    # Python 2 falls back to select.select()
+    selectors = None
 from Exceptions import ChannelNotClosedException
 import platform
+import struct
+
+#The platform does not change while running so resolve it once
+_SYSTEM = platform.system()
+_IS_WINDOWS = ("windows" in _SYSTEM.lower())
+_S_timeval = struct.Struct("ll")
+
+#Linux only.  Disables delayed acknowledgements until the kernel resets it
+try:
+    _TCP_QUICKACK = TCP_QUICKACK
+except NameError:
+    _TCP_QUICKACK = None
+
+#Initial size of the read ahead buffer used by recv().  Data beyond
+#what was asked for is kept for the next call so that reading a message
+#size and then its body usually costs a single system call.  The buffer
+#only grows when a single recv() asks for more than it holds
+_RECV_CHUNK = 65536
 
 class ChannelBase(object):
     """
@@ -24,7 +47,7 @@ class ChannelBase(object):
         Returns:
             string                        The local ip address
         """
-        if ("Linux" == platform.system()):
+        if ("Linux" == _SYSTEM):
             try:
                 s = socket(AF_INET, SOCK_STREAM)
                 s.connect( remote )
@@ -70,13 +93,19 @@ class ChannelBase(object):
         self.__deviceAddress = ""
         self.__connected=False
         self.channel = None
+        self.__selector = None
         self.__port = 16385
         self.__sendTimeOut = 60000
         self.__recvTimeOut = 60000
-        self.__sendBufferSize = 32768
-        self.__recvBufferSize = 32768
+        self.__sendBufferSize = 1048576
+        self.__recvBufferSize = 1048576
         self.__keepAlive = 1
         self.__noDelay = 1        
+        #Data read ahead by recv().  The buffer is kept between calls and
+        #the unread data is between the start and end offsets
+        self.__rxBuffer = bytearray(_RECV_CHUNK)
+        self.__rxStart = 0
+        self.__rxEnd = 0
     def getLocalAddress(self):
         """
         Description:
@@ -163,7 +192,14 @@ class ChannelBase(object):
             try:
                 localAddr=self.channel.getsockname()[0]
             except: pass
+        self.setQuickAck()
          
+        if (None != selectors):
+            self.__selector = selectors.DefaultSelector()
+            self.__selector.register(self.channel, selectors.EVENT_READ)
+
+        self.__rxStart = 0
+        self.__rxEnd = 0
         self.__connected=True
         self.__localAddress = localAddr
         self.__deviceAddress = devAddr
@@ -180,6 +216,13 @@ class ChannelBase(object):
         """
         if (self.getIsOpen() is False): 
             return
+        #Cleared first so getIsOpen never sees a half closed channel
+        self.__connected=False
+        if (None != self.__selector):
+            try:
+                self.__selector.close()
+            except:pass
+            self.__selector = None
         try:
             self.channel.shutdown(SHUT_RDWR)
         except:pass
@@ -187,7 +230,8 @@ class ChannelBase(object):
             self.channel.close()
         except:pass
         self.channel = None
-        self.__connected=False
+        self.__rxStart = 0
+        self.__rxEnd = 0
     def getIsOpen(self):
         """
         Description:
@@ -197,25 +241,82 @@ class ChannelBase(object):
         Returns:
             bool    open state
         """
-        if (None == self.channel): 
-            return False
-        else:
-            return self.__connected
+        #Only set once the channel is connected and cleared before it is
+        #torn down, so a single read needs no lock
+        return self.__connected
     def recv(self, nBytes):
         """
         Description:
-            Reads N-bytes from the communications channel
+            Reads N-bytes from the communications channel.  Whatever
+            else is already available is buffered for the next call
         Arguments:
             nBytes (int)    The number of bytes to read
+        Exceptions:
+            error           The connection was closed
         Returns:
-            (char [])       The data
+            (bytearray)     The data
         """
-        stream = b""
-        nBufBytes=len(stream)
-        while(nBufBytes < nBytes):
-            stream += self.channel.recv(nBytes-nBufBytes)
-            nBufBytes = len(stream)
+        buf = self.__rxBuffer
+        start = self.__rxStart
+        end = self.__rxEnd
+        if (end - start < nBytes):
+            #Move the unread data to the front and grow the buffer only
+            #if it cannot hold the request
+            if (start > 0):
+                buf[:end-start] = buf[start:end]
+                end -= start
+                start = 0
+            if (len(buf) < nBytes):
+                buf.extend(bytearray(nBytes - len(buf)))
+            view = memoryview(buf)
+            try:
+                while(end < nBytes):
+                    nRead = self.channel.recv_into(view[end:], len(buf)-end)
+                    if (0 == nRead):
+                        raise error("The connection was closed by the device")
+                    end += nRead
+            finally:
+                del view
+                self.__rxStart = start
+                self.__rxEnd = end
+        stream = buf[start:start+nBytes]
+        start += nBytes
+        if (start == end):
+            start = end = 0
+            self.__rxEnd = 0
+        self.__rxStart = start
         return stream
+    def recvInto(self, view):
+        """
+        Description:
+            Fills a writable buffer from the communications channel.
+            Buffered data is copied first and the rest is received
+            directly into the buffer, so large messages are not copied
+            again after they are read
+        Arguments:
+            view (in, out, memoryview)    The buffer to fill
+        Exceptions:
+            error           The connection was closed
+        Returns:
+            none
+        """
+        nBytes = len(view)
+        start = self.__rxStart
+        end = self.__rxEnd
+        nBufBytes = min(nBytes, end - start)
+        if (nBufBytes > 0):
+            view[:nBufBytes] = memoryview(self.__rxBuffer)[start:start+nBufBytes]
+            start += nBufBytes
+            if (start == end):
+                start = 0
+                self.__rxEnd = 0
+            self.__rxStart = start
+        if (nBufBytes < nBytes):
+            while(nBufBytes < nBytes):
+                nRead = self.channel.recv_into(view[nBufBytes:], nBytes-nBufBytes)
+                if (0 == nRead):
+                    raise error("The connection was closed by the device")
+                nBufBytes += nRead
     def send(self, stream):
         """
         Description:
@@ -225,11 +326,25 @@ class ChannelBase(object):
         Returns:
             int             The number of bytes sent
         """
-        bufSize=len(stream)
-        nBufBytes=0
-        while(nBufBytes != bufSize):
-            nBufBytes+=self.channel.send(stream[nBufBytes:])
-        return nBufBytes    
+        self.channel.sendall(stream)
+        return len(stream)
+    def setQuickAck(self):
+        """
+        Description:
+            Requests immediate acknowledgement of received data
+            where the OS supports it (Linux).  The OS clears this
+            setting on its own so the channels reapply it once per
+            received message rather than after every read
+        Arguments:
+            none
+        Returns:
+            none
+        """
+        if (None == _TCP_QUICKACK):
+            return
+        try:
+            self.channel.setsockopt(IPPROTO_TCP, _TCP_QUICKACK, 1)
+        except: pass
     def getIsReceiving(self):
         """
         Description:
@@ -240,15 +355,14 @@ class ChannelBase(object):
         Returns:
             bool        The state
         """
-        if (self.getIsOpen()): 
-            inp,outp,err = select.select([self.channel], [], [])
-            if (None == inp):
-                return False
-            elif(len(inp) > 0):
-                return True
-            else:
-                return False
-        return False
+        if (self.getIsOpen() is False): 
+            return False
+        if (self.__rxEnd > self.__rxStart):
+            return True
+        if (None != self.__selector):
+            return (len(self.__selector.select(0)) > 0)
+        inp,outp,err = select.select([self.channel], [], [], 0)
+        return (len(inp) > 0)
     def computeSocketOptTimeout(self, val):
         """
         Description:
@@ -259,12 +373,10 @@ class ChannelBase(object):
         Returns:
             val (int or bytes)   The OS specific timeout 
         """  
-        import platform
-        if "windows" in platform.system().lower():
+        if (_IS_WINDOWS):
             return val
         else:
-            import struct
-            return struct.pack("ll", int(val/1000), int(val % 1000)*1000)
+            return _S_timeval.pack(int(val/1000), int(val % 1000)*1000)
 
     def setProperty(self, name, val):
         """
@@ -277,7 +389,9 @@ class ChannelBase(object):
         Returns:
             none
         """        
-        name = name.lower()
+        #Names are usually lower case already; lower() would copy them
+        if (name.islower() is False):
+            name = name.lower()
         if ("sendbuffersize" == name):            
             val = int(val)
             if (None != self.channel):                 
@@ -340,7 +454,8 @@ class ChannelBase(object):
         Returns:
             any                  The value
         """
-        name = name.lower()        
+        if (name.islower() is False):
+            name = name.lower()
         if ("sendbuffersize" == name):
             return self.__sendBufferSize
         elif ("receivebuffersize" == name):            
@@ -3,6 +3,35 @@ from TypeCode import TypeCode
 from CommandCodes import CommandCodes
 import ApplicationSerializer
 import struct
+import collections
+try:
+    from types import MappingProxyType
+except ImportError:
+    # Python 2 has no read only mapping
+    MappingProxyType = dict
+
+#Command header: code (Int), input (Short), number of arguments (Short)
+_S_HEADER = struct.Struct("<ihh")
+
+#Serialized form of commands without arguments by (code, input).  The
+#control commands (start, stop, clear, ...) are sent repeatedly with
+#no arguments, so their 8 bytes are packed once
+_NOARG_COMMANDS = {}
+_NOARG_COMMANDS_MAX = 256
+
+#Argument classes whose serialized size cannot change after they are
+#added.  The size of commands with other arguments, such as a Spectrum,
+#is not cached because those objects can be changed in place
+_IMMUTABLE_ARGUMENT_TYPES = frozenset([type(None), bool, int, type(2**64), float, str, type(u''), bytes])
+
+#Argument classes that always serialize to the same meta data and
+#format: (type code, struct format character).  Consecutive arguments
+#of one of these classes are written with a single pack call.  Ints are
+#packed signed under the Uint type code, as serialize() writes them
+_RUN_FORMATS = {
+    int: (TypeCode.Uint, 'i'),
+    float: (TypeCode.Double, 'd'),
+}
 
 class InternalCommandCodes(CommandCodes):
     """
@@ -35,6 +64,11 @@ class InternalCommandCodes(CommandCodes):
     GetSCAbuffer=49            #Gets the SCA buffer
     GetSCAdefinitions=50       #Gets the SCA definitions
     PutSCAdefinitions=51       #Sets the SCA definitions    
+
+#Every command code by name.  The code classes stay plain int constants
+#because class attribute access is cheaper than IntEnum member access
+#and IntEnum classes with members cannot be extended
+COMMAND_CODES = MappingProxyType(InternalCommandCodes.getCodes())
     
 class Command(SerializableObject):
     """
@@ -42,6 +76,7 @@ class Command(SerializableObject):
         An instance of this class is used to encapsulate a 
         command that is sent to the Lynx
     """
+    __slots__ = ('__input', '__commandCode', '__args', '__argTypes', '__dataSize')
     def __init__(self, code=InternalCommandCodes.Unknown, input=0):
         """
         Description:
@@ -57,6 +92,63 @@ class Command(SerializableObject):
         self.__input = input
         self.__commandCode = code
         self.__args = []
+        self.__argTypes = []
+        self.__dataSize = None
+    #Released instances waiting to be reused by acquire().  deque
+    #append/pop are atomic so the pool can be shared between threads
+    _POOL = collections.deque(maxlen=256)
+    def acquire(cls, code=InternalCommandCodes.Unknown, input=0):
+        """
+        Description:
+            Returns a command from the pool of released commands
+            or a new one if the pool is empty.  A pooled command is
+            only reset; __init__ is not run again
+        Arguments:
+            code    (in, int) The command code.  See InternalCommandCodes
+                    class or CommandCodes class
+            input   (in, int) The input to receive the command (0-N)
+        Returns:
+            (Command) The command
+        """
+        try:
+            cmd = cls._POOL.pop()
+        except IndexError:
+            return cls(code, input)
+        assert (TypeCode.CommandData == cmd.getType())
+        cmd.reset(code, input)
+        return cmd
+    acquire = classmethod(acquire)
+    def release(self):
+        """
+        Description:
+            Returns this command to the pool.  The command
+            must not be used by the caller afterwards
+        Arguments:
+            none
+        Returns:
+            none
+        """
+        del self.__args[:]
+        self.__argTypes = []
+        self.__dataSize = None
+        Command._POOL.append(self)
+    def reset(self, code=InternalCommandCodes.Unknown, input=0):
+        """
+        Description:
+            Reinitializes this instance with the supplied information
+            and clears the arguments while keeping the list
+        Arguments:
+            code    (in, int) The command code.  See InternalCommandCodes
+                    class or CommandCodes class
+            input   (in, int) The input to receive the command (0-N)
+        Returns:
+            none
+        """
+        self.__input = input
+        self.__commandCode = code
+        del self.__args[:]
+        self.__argTypes = []
+        self.__dataSize = None
     def getInput(self):
         """
         Description:
@@ -87,10 +179,7 @@ class Command(SerializableObject):
         Returns:
             any[]    The arguments
         """
-        args = []
-        for v in self.__args:
-            args.append(v)
-        return args
+        return list(self.__args)
     def addArgument(self, val):
         """
         Description:
@@ -103,9 +192,36 @@ class Command(SerializableObject):
         Returns:
             none
         """
-        #Verify can serialize type by getting the type code
-        tcode = ApplicationSerializer.ApplicationSerializer.getTypeCode(val)
+        #Verify can serialize type.  Skipped under python -O, in which
+        #case an unsupported type is reported when serialized instead
+        if __debug__:
+            ApplicationSerializer.ApplicationSerializer.validateType(val)
         self.__args.append(val)
+        if (None != self.__argTypes):
+            self.__argTypes.append(type(val))
+        self.__dataSize = None
+    def addArguments(self, vals):
+        """
+        Description:
+            Appends several arguments to the list
+            of arguments
+        Arguments:
+            vals (in, any[])    The arguments
+        Exception:
+            UnsupportedTypeException
+        Returns:
+            none
+        """
+        vals = list(vals)
+        #Verify can serialize types.  Skipped under python -O
+        if __debug__:
+            validateType = ApplicationSerializer.ApplicationSerializer.validateType
+            for val in vals:
+                validateType(val)
+        self.__args.extend(vals)
+        if (None != self.__argTypes):
+            self.__argTypes.extend([type(val) for val in vals])
+        self.__dataSize = None
     def clearArguments(self):
         """
         Description:
@@ -116,6 +232,8 @@ class Command(SerializableObject):
             none
         """
         self.__args = []
+        self.__argTypes = []
+        self.__dataSize = None
     def getDataSize(self):
         """
         Description:
@@ -126,25 +244,66 @@ class Command(SerializableObject):
         Returns:
             (int)    The value
         """
+        #Cached until the arguments change, unless an argument is mutable
+        if (None != self.__dataSize):
+            return self.__dataSize
+        getTypeSize = ApplicationSerializer.ApplicationSerializer.getTypeSize
         cnt = 8
+        cache = True
         for v in self.__args:
-            cnt += ApplicationSerializer.ApplicationSerializer.getTypeSize(v)
+            cnt += getTypeSize(v)
+            if (type(v) not in _IMMUTABLE_ARGUMENT_TYPES):
+                cache = False
+        if (cache):
+            self.__dataSize = cnt
         return cnt
-    def serializeData(self, stream=b''):
+    def serializeData(self, stream=None):
         """
         Description:
             Serializes all data contained in this instace into
             a stream
         Arguments:
-            stream (in, char [])    The stream to append to
+            stream (in, out, bytearray)    The stream to append to.  If not
+                                           supplied, a new stream is created
         Returns:
-            char[]    The stream containing the results
+            bytearray    The stream containing the results
         """
-        stream += ApplicationSerializer.ApplicationSerializer.serialize(self.__commandCode)
-        stream += ApplicationSerializer.ApplicationSerializer.serialize(self.__input, objTypeCode=TypeCode.Short)
-        stream += ApplicationSerializer.ApplicationSerializer.serialize(len(self.__args), objTypeCode=TypeCode.Short)
-        for v in self.__args:
-            stream += ApplicationSerializer.ApplicationSerializer.serialize(v, writeMeta=True)
+        if (None == stream):
+            stream = bytearray()
+        elif (isinstance(stream, bytearray) is False):
+            stream = bytearray(stream)
+        args = self.__args
+        if (0 == len(args)):
+            key = (self.__commandCode, self.__input)
+            data = _NOARG_COMMANDS.get(key)
+            if (None == data):
+                if (len(_NOARG_COMMANDS) >= _NOARG_COMMANDS_MAX):
+                    _NOARG_COMMANDS.clear()
+                data = _NOARG_COMMANDS[key] = _S_HEADER.pack(self.__commandCode, self.__input, 0)
+            stream += data
+            return stream
+        #The stream is not presized from getDataSize() because that is the
+        #protocol size, which excludes the argument meta data that is written
+        stream += _S_HEADER.pack(self.__commandCode, self.__input, len(args))
+        serialize = ApplicationSerializer.ApplicationSerializer.serialize
+        serializeRun = ApplicationSerializer.ApplicationSerializer.serializeArrayWithMeta
+        argTypes = self.__argTypes
+        if (None == argTypes):
+            argTypes = self.__argTypes = [type(v) for v in args]
+        count = len(args)
+        i = 0
+        while (i < count):
+            #Find the run of arguments with the same class as this one
+            runFormat = _RUN_FORMATS.get(argTypes[i])
+            j = i + 1
+            if (None != runFormat):
+                while ((j < count) and (argTypes[j] is argTypes[i])):
+                    j += 1
+            if (j - i > 1):
+                stream = serializeRun(stream, runFormat[0], args[i:j], runFormat[1])
+            else:
+                stream = serialize(args[i], stream, True)
+            i = j
         return stream
     def deserializeData(self, stream):
         """
@@ -154,14 +313,33 @@ class Command(SerializableObject):
         Arguments:
             stream (in, char [])    The stream to append to
         Returns:
-            char[]    The stream minus the deserialized data
+            memoryview    The stream minus the deserialized data
         """
-        self.__args = []
-        [self.__commandCode, stream] = ApplicationSerializer.ApplicationSerializer.deserialize(stream, TypeCode.Int) 
-        [self.__input, stream] = ApplicationSerializer.ApplicationSerializer.deserialize(stream, TypeCode.Short) 
-        [numArgs, stream] = ApplicationSerializer.ApplicationSerializer.deserialize(stream, TypeCode.Short)
-        for i in range(0, numArgs):
-            [v,stream] = ApplicationSerializer.ApplicationSerializer.deserialize(stream) 
-            self.__args.append(v)
-        return stream
+        stream = memoryview(stream)
+        return stream[self.deserializeFrom(stream, 0):]
+    def deserializeFrom(self, stream, offset):
+        """
+        Description:
+            Deserializes the command starting at the offset without
+            slicing the stream for every argument
+        Arguments:
+            stream (in, memoryview)    The stream containing the data
+            offset (in, int)           The offset of the data within the stream
+        Returns:
+            int    The offset following the deserialized data
+        """
+        args = self.__args = []
+        #The argument classes are only collected if this is serialized
+        self.__argTypes = None
+        self.__dataSize = None
+        [self.__commandCode, self.__input, numArgs] = _S_HEADER.unpack_from(stream, offset)
+        offset += _S_HEADER.size
+        #Bind the lookups used for every argument to locals
+        deserializeFrom = ApplicationSerializer.ApplicationSerializer.deserializeFrom
+        append = args.append
+        while (numArgs > 0):
+            [v, offset] = deserializeFrom(stream, offset)
+            append(v)
+            numArgs -= 1
+        return offset
         
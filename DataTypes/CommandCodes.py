@@ -29,3 +29,38 @@ class CommandCodes(object):
     SCAcountersClear=52      #Clears all SCA counters and timers
     SCAcountersLatch=53      #Latches SCA counters and timers
     SCAcountersLatchAndClear=54 #Latches SCA and clears counters and timers
+
+    def getName(cls, code):
+        """
+        Description:
+            Returns the name of a command code.  The code to name
+            map is built once per class on first use
+        Arguments:
+            code (in, int)    The command code
+        Returns:
+            string    The name or 'Unknown' when the code is not defined
+        """
+        names = cls.__dict__.get('_codeNames')
+        if (None == names):
+            names = dict((val, name) for (name, val) in cls.getCodes().items())
+            cls._codeNames = names
+        return names.get(code, 'Unknown')
+    getName = classmethod(getName)
+
+    def getCodes(cls):
+        """
+        Description:
+            Collects the command codes of this class, including
+            the inherited ones
+        Arguments:
+            none
+        Returns:
+            dict    The name to command code map
+        """
+        codes = {}
+        for name in dir(cls):
+            val = getattr(cls, name)
+            if ((name.startswith('_') is False) and isinstance(val, int)):
+                codes[name] = val
+        return codes
+    getCodes = classmethod(getCodes)
@@ -15,11 +15,84 @@ from Spectrum import Spectrum
 from StreamChannel import StreamChannel
 from SCAbuffer import SCAbuffer
 from SCAdefinitions import SCAdefinitions
+from SerializableObject import SerializableObject
+from DigitalOscilloscopeData import DigitalOscilloscopeData
+import contextlib
+import struct
+import threading
+try:
+    import numpy
+except ImportError:
+    # numpy is optional.  Counts may also be passed as a list or tuple
+    numpy = None
+try:
+    from com.canberra.exceptions.NativeErrorCodes import DSA3K_USERNOTEXIST
+except ImportError:
+    # The native error codes are not part of this package
+    DSA3K_USERNOTEXIST = None
 from sys import version_info
 if version_info[0] >= 3:
     long = int
     unicode = str
 
+#Types of the error code that a response starts with on a failure
+if version_info[0] >= 3:
+    _INT_TYPES = (int,)
+else:
+    _INT_TYPES = (int, long)
+
+#Start of a serialized response: meta data type and size followed by the
+#command header (code, input, number of arguments)
+_S_RESPONSE = struct.Struct("<iiihh")
+
+#Size (Int) that every message starts with
+_S_SIZE = struct.Struct("<i")
+
+#Serialized request commands by (code, input, arguments, argument types).
+#The requests of the getters only differ by their input and a few integer
+#arguments, so each distinct command is serialized once.  The message
+#header, signature and CRC are still built for every send
+_REQUEST_DATA = {}
+_REQUEST_DATA_MAX = 256
+
+def _getRequestMessage(code, input, args):
+    """
+    Description:
+        Returns the message of a command.  The command is only
+        serialized the first time it is requested
+    Arguments:
+        code (in, int)      The command code
+        input (in, int)     The input
+        args (in, tuple)    The command arguments
+    Returns:
+        bytearray           The message
+    """
+    #The types are part of the key because True == 1 but serializes differently
+    key = (code, input, args, tuple([type(arg) for arg in args]))
+    data = _REQUEST_DATA.get(key)
+    if (None == data):
+        cmd = Command.acquire(code, input)
+        cmd.addArguments(args)
+        data = bytes(ApplicationSerializer.serialize(cmd, writeMeta=True))
+        cmd.release()
+        if (len(_REQUEST_DATA) >= _REQUEST_DATA_MAX):
+            _REQUEST_DATA.clear()
+        _REQUEST_DATA[key] = data
+    return MessageFactory.serializeDataToMessage(data)
+
+#Getters that getMany can batch: the method name and its arguments map to
+#(request message, expected response type, conversion of the response or None)
+_BATCH_REQUESTS = {
+    'getSpectrum': lambda input, group=1: (_getRequestMessage(InternalCommandCodes.GetSpectrum, input, (group,)), Spectrum, None),
+    'getSpectralData': lambda input, group=1: (_getRequestMessage(InternalCommandCodes.GetSpectralData, input, (group,)), SpectralData, None),
+    'getCounterData': lambda input=1: (_getRequestMessage(InternalCommandCodes.GetCounterData, input, ()), CounterData, None),
+    'getDsoData': lambda input=1: (_getRequestMessage(InternalCommandCodes.GetDsoData, input, ()), DigitalOscilloscopeData, lambda resp: resp.data),
+    'getParameter': lambda code, input: (_getRequestMessage(InternalCommandCodes.GetParameter, input, (code,)), Parameter, lambda resp: resp.getValue()),
+    'getParameterAttributes': lambda code, input: (_getRequestMessage(InternalCommandCodes.GetParameter, input, (code, 0)), ParameterAttributes, None),
+    'getSCAdefinitions': lambda input=1: (_getRequestMessage(InternalCommandCodes.GetSCAdefinitions, input, ()), SCAdefinitions, None),
+    'getSCAbufferData': lambda input=1: (_getRequestMessage(InternalCommandCodes.GetSCAbuffer, input, ()), SCAbuffer, None),
+}
+
 class ConfigurationChannel(ChannelBase):
     """
     Description:
@@ -36,6 +109,17 @@ class ConfigurationChannel(ChannelBase):
         """
         ChannelBase.__init__(self)     
         self.__streamChannel = StreamChannel()
+        #Serialized messages waiting to be sent while pipelining, else None
+        self.__pipeline = None
+        self.__pipelineCount = 0
+        #Serializes the requests and responses of concurrent callers.
+        #Reentrant so a pipeline block can issue commands while holding it;
+        #threading.RLock is the C implementation on Python 3
+        self.__lock = threading.RLock()
+        #Serializes the readers of the stream channel.  The stream is read
+        #without holding __lock so Stop or Abort from another thread is not
+        #held up while a reader waits for data
+        self.__streamLock = threading.Lock()
     
     def open(self, localAddr, devAddr):
         """
@@ -48,8 +132,9 @@ class ConfigurationChannel(ChannelBase):
         Returns:
             None        
         """
-        ChannelBase.open(self, localAddr, devAddr)
-        self.__streamChannel.open(localAddr, devAddr)        
+        with self.__lock:
+            ChannelBase.open(self, localAddr, devAddr)
+            self.__streamChannel.open(localAddr, devAddr)        
     
     def close(self):
         """
@@ -62,8 +147,145 @@ class ConfigurationChannel(ChannelBase):
         Returns:
             None        
         """
-        ChannelBase.close(self)
-        self.__streamChannel.close()            
+        with self.__lock:
+            ChannelBase.close(self)
+            self.__streamChannel.close()            
+    def pipeline(self):
+        """
+        Description:
+            Returns a context manager that queues the commands which
+            do not return data (setParameter, lock, control, ...)
+            and sends them as one transmission when the block exits.
+            The responses are then read and checked in order.  A
+            command that returns data flushes the queue first.
+            If the block raises, the queued commands are discarded.
+            Use this to batch configuration changes, for example
+            setSCAdefinitions followed by setParameter calls.  The
+            queued messages share TCP segments without needing
+            TCP_CORK, and TCP_NODELAY (the "nodelay" property, on by
+            default) keeps the last segment from being delayed
+        Arguments:
+            none
+        Exceptions:
+            DeviceErrorException    The first error returned by
+                                    any of the queued commands
+            InvalidResponseException
+        Returns:
+            context manager
+        """
+        #Other threads wait until the queued commands are answered
+        with self.__lock:
+            if (None != self.__pipeline):
+                #Already pipelining, the outer block sends the commands
+                yield self
+                return
+            self.__pipeline = bytearray()
+            self.__pipelineCount = 0
+            try:
+                yield self
+            except:
+                self.__pipeline = None
+                raise
+            try:
+                self.__flushPipeline()
+            finally:
+                self.__pipeline = None
+    pipeline = contextlib.contextmanager(pipeline)
+    def __flushPipeline(self):
+        """
+        Description:
+            Sends the queued commands in a single transmission and
+            reads all of their responses.  Every response is read
+            before an error is raised so the channel stays in step
+        Arguments:
+            none
+        Exceptions:
+            DeviceErrorException
+            InvalidResponseException
+        Returns:
+            none
+        """
+        count = self.__pipelineCount
+        if (0 == count):
+            return
+        self.send(self.__pipeline)
+        self.__pipeline = bytearray()
+        self.__pipelineCount = 0
+        error = None
+        for _ in range(count):
+            try:
+                self.__receiveEmptyResponse()
+            except (DeviceErrorException, InvalidResponseException) as e:
+                if (None == error):
+                    error = e
+        if (None != error):
+            raise error
+    def __receiveMessage(self):
+        """
+        Description:
+            Reads one complete message
+        Arguments:
+            none
+        Returns:
+            memoryview         The message
+        """
+        head=self.recv(4)
+        msgSize = _S_SIZE.unpack_from(head, 0)[0]
+        #Receive the rest of the message in place rather than appending
+        stream = bytearray(max(msgSize, 4))
+        stream[:4] = head
+        self.recvInto(memoryview(stream)[4:])
+        self.setQuickAck()
+        return memoryview(stream)
+    def __receiveEmptyResponse(self):
+        """
+        Description:
+            Reads the response to a command that returns no
+            data and checks it for errors.  Only the command
+            header and the first argument, if any, are decoded
+        Arguments:
+            none
+        Exceptions:
+            DeviceErrorException
+            InvalidResponseException
+        Returns:
+            none
+        """
+        stream = MessageFactory.getMessageData(self.__receiveMessage())
+        if (len(stream) < _S_RESPONSE.size):
+            raise InvalidResponseException()
+        [dataType, dataSize, code, input, numArgs] = _S_RESPONSE.unpack_from(stream, 0)
+        if ((TypeCode.CommandData != dataType) or (InternalCommandCodes.Response != code)):
+            raise InvalidResponseException()
+        if (0 == numArgs):
+            return
+        [err, offset] = ApplicationSerializer.deserializeFrom(stream, _S_RESPONSE.size)
+        if (isinstance(err, _INT_TYPES)):
+            raise DeviceErrorException(err)
+        raise InvalidResponseException()
+    def __receiveResponse(self):
+        """
+        Description:
+            Reads the response to a command and checks
+            it for errors
+        Arguments:
+            none
+        Exceptions:
+            DeviceErrorException
+            InvalidResponseException
+        Returns:
+            any[]              The response arguments
+        """
+        [msg, stream] = MessageFactory.deserializeFromMessage(self.__receiveMessage())
+        if (isinstance(msg, Command) is False):
+            raise InvalidResponseException()
+        if (InternalCommandCodes.Response != msg.getCommandCode()):
+            raise InvalidResponseException()
+        
+        resp = msg.getArguments()
+        if ((len(resp) > 0) and isinstance(resp[0], _INT_TYPES)):
+            raise DeviceErrorException(resp[0])
+        return resp
     def __controlWithResponse(self, cmd):
         """
         Description:
@@ -85,28 +307,88 @@ class ConfigurationChannel(ChannelBase):
         Returns:
             any                Data from the device
         """
-        if (self.getIsOpen() is False):
-            raise ChannelNotOpenException()
         stream = MessageFactory.serializeToMessage(cmd)
-        self.send(stream)
-        stream=self.recv(4)
-        [msgSize, dum] = ApplicationSerializer.deserialize(stream, TypeCode.Int)
-        stream+=self.recv(msgSize-len(stream))
-        [msg, stream] = MessageFactory.deserializeFromMessage(stream)
-        if (isinstance(msg, Command) is False):
-            raise InvalidResponseException()
-        if (InternalCommandCodes.Response != msg.getCommandCode()):
+        cmd.release()
+        return self.__controlMessage(stream)
+    def __controlMessage(self, stream):
+        """
+        Description:
+            This method will send a serialized command and
+            return the response data.  See __controlWithResponse
+        Arguments:
+            stream (in, bytes)    The serialized command message
+        Exceptions:
+            ChannelNotOpenException
+            DeviceErrorException
+            InvalidResponseException
+        Returns:
+            any                Data from the device
+        """
+        with self.__lock:
+            if (self.getIsOpen() is False):
+                raise ChannelNotOpenException()
+            #Queued commands must be answered before this one
+            self.__flushPipeline()
+            self.send(stream)
+            return self.__receiveResponse()
+    def __controlWithResponses(self, streams, expected):
+        """
+        Description:
+            This method will execute several commands with a single
+            transmission and then read all of the responses, so the
+            commands cost one round trip instead of one each.  Every
+            response must be a single value of a known type
+        Arguments:
+            streams (in, bytes[])   The serialized command messages
+            expected (in, class or class[]) The expected type of the
+                                    responses, or of each response
+        Exceptions:
+            DeviceErrorException        The first error returned by
+                                        any of the commands
+            InvalidResponseException
+        Returns:
+            any[]              The first value of each response
+        """
+        with self.__lock:
+            if (self.getIsOpen() is False):
+                raise ChannelNotOpenException()
+            self.__flushPipeline()
+            self.send(b''.join(streams))
+            if (isinstance(expected, list) is False):
+                expected = [expected] * len(streams)
+            ret = []
+            error = None
+            for i in range(len(streams)):
+                try:
+                    resp = self.__receiveResponse()
+                    if ((0 == len(resp)) or (isinstance(resp[0], expected[i]) is False)):
+                        raise InvalidResponseException()
+                    ret.append(resp[0])
+                except (DeviceErrorException, InvalidResponseException) as e:
+                    #Keep reading so the channel stays in step
+                    if (None == error):
+                        error = e
+            if (None != error):
+                raise error
+            return ret
+    def __controlWithTypedResponse(self, stream, expected):
+        """
+        Description:
+            This method will execute a command whose response
+            is a single value of a known type
+        Arguments:
+            stream (in, bytes)      The serialized command message
+            expected (in, class)    The expected type of the response
+        Exceptions:
+            InvalidResponseException    The response is not of the
+                                        expected type
+        Returns:
+            any                The first value of the response
+        """
+        resp = self.__controlMessage(stream)
+        if ((0 == len(resp)) or (isinstance(resp[0], expected) is False)):
             raise InvalidResponseException()
-        
-        resp = msg.getArguments()
-        import sys
-        if (sys.version_info >= (3, 0)):
-            if ((len(resp) > 0) and isinstance(resp[0], int)):
-                raise DeviceErrorException(resp[0])
-        else:
-            if ((len(resp) > 0) and (isinstance(resp[0], long) or isinstance(resp[0], int))):
-                raise DeviceErrorException(resp[0])
-        return msg.getArguments()
+        return resp[0]
     def __controlWithoutResponse(self, cmd):
         """
         Description:
@@ -127,12 +409,21 @@ class ConfigurationChannel(ChannelBase):
         Returns:
             none
         """
-        resp = self.__controlWithResponse(cmd)
-        if (None == resp):
-            return
-        elif(0 == len(resp)):
-            return
-        raise InvalidResponseException()
+        with self.__lock:
+            if (None != self.__pipeline):
+                if (self.getIsOpen() is False):
+                    raise ChannelNotOpenException()
+                MessageFactory.serializeToMessage(cmd, self.__pipeline)
+                self.__pipelineCount += 1
+                cmd.release()
+                return
+            if (self.getIsOpen() is False):
+                raise ChannelNotOpenException()
+            stream = MessageFactory.serializeToMessage(cmd)
+            cmd.release()
+            self.__flushPipeline()
+            self.send(stream)
+            self.__receiveEmptyResponse()
     def getSpectrum(self, input, group=1):
         """
         Description:
@@ -152,19 +443,74 @@ class ConfigurationChannel(ChannelBase):
         Returns:
             Spectrum
         """
-        cmd = Command(InternalCommandCodes.GetSpectrum, input)
-        cmd.addArgument(group)
-        resp=self.__controlWithResponse(cmd)
-        if (isinstance(resp[0], Spectrum) is False):
-            raise InvalidResponseException()
-        return resp[0]
+        return self.__controlWithTypedResponse(_getRequestMessage(InternalCommandCodes.GetSpectrum, input, (group,)), Spectrum)
+    def getSpectrumList(self, inputs, group=1):
+        """
+        Description:
+            This method will get the spectrum from several
+            inputs with a single round trip to the device
+        Arguments:
+            inputs (in, int[])  The inputs
+            group (in, int)     The memory group
+        Exceptions:
+            ChecksumException
+            DigitalSignatureException
+            InvalidResponseException
+            MessageVersionException
+            SerializationException
+            UnsupportedCompressionException
+            UnsupportedTypeException
+        Returns:
+            Spectrum[]          The spectra in the order of the inputs
+        """
+        return self.__controlWithResponses([_getRequestMessage(InternalCommandCodes.GetSpectrum, input, (group,)) for input in inputs], Spectrum)
+    def getMany(self, requests):
+        """
+        Description:
+            This method will execute several getters with a single
+            round trip to the device.  The getters that can be batched
+            are getSpectrum, getSpectralData, getCounterData, getDsoData,
+            getParameter, getParameterAttributes, getSCAdefinitions and
+            getSCAbufferData
+        Arguments:
+            requests (in, (string, tuple)[]) The name of each getter and
+                                             its arguments, for example
+                                             ('getSpectralData', (1,))
+        Exceptions:
+            ChecksumException
+            DigitalSignatureException
+            InvalidArgumentException    A getter cannot be batched
+            InvalidResponseException
+            MessageVersionException
+            SerializationException
+            UnsupportedCompressionException
+            UnsupportedTypeException
+        Returns:
+            any[]               The result of each getter, in order
+        """
+        streams = []
+        expected = []
+        converters = []
+        for (name, args) in requests:
+            build = _BATCH_REQUESTS.get(name)
+            if (None == build):
+                raise InvalidArgumentException()
+            [stream, cls, convert] = build(*args)
+            streams.append(stream)
+            expected.append(cls)
+            converters.append(convert)
+        ret = self.__controlWithResponses(streams, expected)
+        for i in range(len(ret)):
+            if (None != converters[i]):
+                ret[i] = converters[i](ret[i])
+        return ret
     def setSpectrum(self, data, input, group=1):
         """
         Description:
             This method will set the spectrum
             into an input and memory group
         Arguments:
-            data (in, Spectrum) The spectrum
+            data (in, Spectrum, int[] or numpy.ndarray) The spectrum
             input (in, int)    The input
             group (in, int)    The memory group
         Exceptions:
@@ -178,13 +524,14 @@ class ConfigurationChannel(ChannelBase):
         Returns:
             none
         """
-        from SerializableObject import SerializableObject
-        from TypeCode import TypeCode
-        cmd = Command(InternalCommandCodes.PutSpectrum, input)
+        cmd = Command.acquire(InternalCommandCodes.PutSpectrum, input)
         cmd.addArgument(group)
-        if isinstance(data, list):
+        #Spectrum keeps a reference to the counts so wrapping does not copy
+        if isinstance(data, Spectrum):
+            pass
+        elif isinstance(data, (list, tuple)):
             data = Spectrum(data)
-        elif isinstance(data, tuple):
+        elif ((None != numpy) and isinstance(data, numpy.ndarray)):
             data = Spectrum(data)
         elif not isinstance(data, SerializableObject) or (TypeCode.SpectralData != data.getType()):
             raise InvalidArgumentException()
@@ -211,19 +558,24 @@ class ConfigurationChannel(ChannelBase):
         """        
         if (self.__streamChannel.getActive()):            
             try:
-                msg = self.__streamChannel.receiveCommand()
+                with self.__streamLock:
+                    msg = self.__streamChannel.receiveCommand()
             except AbortException:
                 return None            
             if (InternalCommandCodes.Response != msg.getCommandCode()):
                 raise InvalidResponseException()            
             resp = msg.getArguments()
         else:
-            cmd = Command(InternalCommandCodes.GetMSSData, input)
-            resp=self.__controlWithResponse(cmd)
+            resp=self.__controlMessage(_getRequestMessage(InternalCommandCodes.GetMSSData, input, ()))
             
-        for data in resp:            
-            if (isinstance(data, PhaData) is False):
-                raise InvalidResponseException()
+        #The serializer produces a list of one type so checking the first
+        #element is enough.  Every element is checked in debug runs only
+        if ((len(resp) > 0) and (isinstance(resp[0], PhaData) is False)):
+            raise InvalidResponseException()
+        if __debug__:
+            for data in resp:            
+                if (isinstance(data, PhaData) is False):
+                    raise InvalidResponseException()
         return resp
     def getSpectralData(self, input, group=1):
         """
@@ -246,12 +598,27 @@ class ConfigurationChannel(ChannelBase):
         Returns:
             SpectralData
         """
-        cmd = Command(InternalCommandCodes.GetSpectralData, input)
-        cmd.addArgument(group)
-        resp=self.__controlWithResponse(cmd)
-        if (isinstance(resp[0], SpectralData) is False):
-            raise InvalidResponseException()
-        return resp[0]
+        return self.__controlWithTypedResponse(_getRequestMessage(InternalCommandCodes.GetSpectralData, input, (group,)), SpectralData)
+    def getSpectralDataList(self, inputs, group=1):
+        """
+        Description:
+            This method will get spectral data from several
+            inputs with a single round trip to the device
+        Arguments:
+            inputs (in, int[])  The inputs
+            group (in, int)     The group
+        Exceptions:
+            ChecksumException
+            DigitalSignatureException
+            InvalidResponseException
+            MessageVersionException
+            SerializationException
+            UnsupportedCompressionException
+            UnsupportedTypeException
+        Returns:
+            SpectralData[]      The data in the order of the inputs
+        """
+        return self.__controlWithResponses([_getRequestMessage(InternalCommandCodes.GetSpectralData, input, (group,)) for input in inputs], SpectralData)
     def getDsoData(self, input=1):
         """
         Description:
@@ -269,12 +636,7 @@ class ConfigurationChannel(ChannelBase):
         Returns:
             DigitalOscilloscopeData
         """
-        from DigitalOscilloscopeData import DigitalOscilloscopeData
-        cmd = Command(InternalCommandCodes.GetDsoData, input)
-        resp=self.__controlWithResponse(cmd)
-        if (isinstance(resp[0], DigitalOscilloscopeData) is False):
-            raise InvalidResponseException()
-        return resp[0].data
+        return self.__controlWithTypedResponse(_getRequestMessage(InternalCommandCodes.GetDsoData, input, ()), DigitalOscilloscopeData).data
     def getCounterData(self, input=1):
         """
         Description:
@@ -293,11 +655,7 @@ class ConfigurationChannel(ChannelBase):
         Returns:
             CounterData
         """
-        cmd = Command(InternalCommandCodes.GetCounterData, input)
-        resp=self.__controlWithResponse(cmd)
-        if (isinstance(resp[0], CounterData) is False):
-            raise InvalidResponseException()
-        return resp[0]
+        return self.__controlWithTypedResponse(_getRequestMessage(InternalCommandCodes.GetCounterData, input, ()), CounterData)
     def getListData(self, input=1):
         """
         Description:
@@ -317,22 +675,18 @@ class ConfigurationChannel(ChannelBase):
         """
         if (self.__streamChannel.getActive()):            
             try:
-                msg = self.__streamChannel.receiveCommand()
+                with self.__streamLock:
+                    msg = self.__streamChannel.receiveCommand()
             except AbortException:
                 return None
             resp = msg.getArguments()
-            if ((len(resp) > 0) and (isinstance(resp[0], int))):
+            if ((len(resp) > 0) and (isinstance(resp[0], _INT_TYPES))):
                 raise DeviceErrorException(resp[0])
-            resp = msg.getArguments()
             if (isinstance(resp[0], ListDataBase) is False):
                 raise InvalidResponseException()
             return resp[0]
         else:
-            cmd = Command(InternalCommandCodes.GetListData, input)
-            resp=self.__controlWithResponse(cmd)
-            if (isinstance(resp[0], ListDataBase) is False):
-                raise InvalidResponseException()
-            return resp[0]
+            return self.__controlWithTypedResponse(_getRequestMessage(InternalCommandCodes.GetListData, input, ()), ListDataBase)
     def control(self, code, input, args=None):
         """
         Description:
@@ -352,11 +706,10 @@ class ConfigurationChannel(ChannelBase):
         Returns:
             none
         """
-        cmd = Command(code, input)
+        cmd = Command.acquire(code, input)
         if not args is None:
             if isinstance(args, (list, tuple)):
-                for arg in args:
-                    cmd.addArgument(arg)
+                cmd.addArguments(args)
             else:
                 cmd.addArgument(args)
         if InternalCommandCodes.DriverCommand == code:
@@ -383,7 +736,7 @@ class ConfigurationChannel(ChannelBase):
         Returns:
             none
         """
-        cmd = Command(InternalCommandCodes.Lock, input)
+        cmd = Command.acquire(InternalCommandCodes.Lock, input)
         cmd.addArgument(usr)
         cmd.addArgument(pwd)
         cmd.addArgument(self.getLocalAddress())
@@ -407,11 +760,10 @@ class ConfigurationChannel(ChannelBase):
         Returns:
             none
         """
-        cmd = Command(InternalCommandCodes.Unlock, input)
+        cmd = Command.acquire(InternalCommandCodes.Unlock, input)
         cmd.addArgument(usr)
         cmd.addArgument(pwd)
-        locAddr=self._ChannelBase__localAddress
-        cmd.addArgument(locAddr)
+        cmd.addArgument(self.getLocalAddress())
         self.__controlWithoutResponse(cmd)
     def addUser(self, usr, pwd, desc, attr):
         """
@@ -433,7 +785,7 @@ class ConfigurationChannel(ChannelBase):
         Returns:
             none
         """
-        cmd = Command(InternalCommandCodes.AddUser, 0)
+        cmd = Command.acquire(InternalCommandCodes.AddUser, 0)
         cmd.addArgument(usr)
         cmd.addArgument(pwd)
         cmd.addArgument(desc)
@@ -459,7 +811,7 @@ class ConfigurationChannel(ChannelBase):
         Returns:
             none
         """
-        cmd = Command(InternalCommandCodes.UpdateUser, 0)
+        cmd = Command.acquire(InternalCommandCodes.UpdateUser, 0)
         cmd.addArgument(usr)
         cmd.addArgument(pwd)
         cmd.addArgument(desc)
@@ -482,7 +834,7 @@ class ConfigurationChannel(ChannelBase):
         Returns:
             none
         """
-        cmd = Command(InternalCommandCodes.DeleteUser, 0)
+        cmd = Command.acquire(InternalCommandCodes.DeleteUser, 0)
         cmd.addArgument(usr)
         self.__controlWithoutResponse(cmd)
     def validateUser(self, usr, pwd):
@@ -503,19 +855,37 @@ class ConfigurationChannel(ChannelBase):
         Returns:
             none
         """
-        cmd = Command(InternalCommandCodes.ValidateUser, 0)
+        cmd = Command.acquire(InternalCommandCodes.ValidateUser, 0)
         cmd.addArgument(usr)
         cmd.addArgument(pwd)   
         try:     
             self.__controlWithoutResponse(cmd)
         except DeviceErrorException as info:
-            from com.canberra.exceptions.NativeErrorCodes import DSA3K_USERNOTEXIST
-            if DSA3K_USERNOTEXIST != info.errorCode:
+            if DSA3K_USERNOTEXIST != info.getErrorCode():
                 raise info
             else:
                 return False
                 
         return True
+    def userExists(self, usr):
+        """
+        Description:
+            This method will determine whether a user account
+            exists without raising an exception when it does not
+        Arguments:
+            usr (in, string)    The user name
+        Exceptions:
+            ChecksumException
+            DigitalSignatureException
+            InvalidResponseException
+            MessageVersionException
+            SerializationException
+            UnsupportedCompressionException
+            UnsupportedTypeException
+        Returns:
+            bool                True if the account exists
+        """
+        return (usr in self.enumerateUsers())
     def enumerateUsers(self):
         """
         Description:
@@ -533,8 +903,7 @@ class ConfigurationChannel(ChannelBase):
         Returns:
             string[]    
         """
-        cmd = Command(InternalCommandCodes.EnumerateUsers, 0)
-        resp=self.__controlWithResponse(cmd)
+        resp=self.__controlMessage(_getRequestMessage(InternalCommandCodes.EnumerateUsers, 0, ()))
         return resp
     def save(self, input, group):
         """
@@ -555,12 +924,7 @@ class ConfigurationChannel(ChannelBase):
         Returns:
             string    The file name
         """
-        cmd = Command(InternalCommandCodes.Save, input)
-        cmd.addArgument(group)
-        resp = self.__controlWithResponse(cmd)
-        if (isinstance(resp[0], unicode) is False):
-            raise InvalidResponseException()
-        return resp[0]
+        return self.__controlWithTypedResponse(_getRequestMessage(InternalCommandCodes.Save, input, (group,)), unicode)
     def getRegionsOfInterest(self, input):
         """
         Description:
@@ -578,8 +942,7 @@ class ConfigurationChannel(ChannelBase):
         Returns:
             RegionOfInterest[]
         """
-        cmd = Command(InternalCommandCodes.GetRegionsOfInterest, input)        
-        resp=self.__controlWithResponse(cmd)
+        resp=self.__controlMessage(_getRequestMessage(InternalCommandCodes.GetRegionsOfInterest, input, ()))
         for rgn in resp:
             if (isinstance(rgn, RegionOfInterest) is False):
                 raise InvalidResponseException()
@@ -602,13 +965,11 @@ class ConfigurationChannel(ChannelBase):
         Returns:
             none
         """
-        from SerializableObject import SerializableObject
-        from TypeCode import TypeCode
-        cmd = Command(InternalCommandCodes.PutRegionsOfInterest, input)
+        cmd = Command.acquire(InternalCommandCodes.PutRegionsOfInterest, input)
         for rgn in rgns:
             if not isinstance(rgn, SerializableObject) or (TypeCode.RegionOfInterestData != rgn.getType()):
                 raise InvalidArgumentException()
-            cmd.addArgument(rgn)
+        cmd.addArguments(rgns)
         self.__controlWithoutResponse(cmd)
     def getParameterAttributes(self, code, input):
         """
@@ -630,13 +991,7 @@ class ConfigurationChannel(ChannelBase):
         Returns:
             ParameterAttributes
         """
-        cmd = Command(InternalCommandCodes.GetParameter, input)
-        cmd.addArgument(code)
-        cmd.addArgument(0)
-        resp=self.__controlWithResponse(cmd)
-        if (isinstance(resp[0], ParameterAttributes) is False):
-            raise InvalidResponseException()
-        return resp[0]
+        return self.__controlWithTypedResponse(_getRequestMessage(InternalCommandCodes.GetParameter, input, (code, 0)), ParameterAttributes)
     def getParameter(self, code, input):
         """
         Description:
@@ -655,9 +1010,7 @@ class ConfigurationChannel(ChannelBase):
         Returns:
             any
         """
-        cmd = Command(InternalCommandCodes.GetParameter, input)
-        cmd.addArgument(code)
-        return self.__controlWithResponse(cmd)[0].getValue()
+        return self.__controlMessage(_getRequestMessage(InternalCommandCodes.GetParameter, input, (code,)))[0].getValue()
 
     def getParameterList(self, code, input):
         """
@@ -677,16 +1030,12 @@ class ConfigurationChannel(ChannelBase):
         Returns:
             any[]
         """
-        cmd = Command(InternalCommandCodes.GetParameterList, input)
-        for c in code:
-            cmd.addArgument(c)
+        cmd = Command.acquire(InternalCommandCodes.GetParameterList, input)
+        cmd.addArguments(code)
         resp=self.__controlWithResponse(cmd)
         if (isinstance(resp, list) is False):
             raise InvalidResponseException()
-        ret = []
-        for p in resp:
-            ret.append(p.getValue())
-        return ret
+        return [p.getValue() for p in resp]
     def setParameter(self, code, val, input):
         """
         Description:
@@ -706,7 +1055,7 @@ class ConfigurationChannel(ChannelBase):
         Returns:
             none
         """
-        cmd = Command(InternalCommandCodes.PutParameter, input)
+        cmd = Command.acquire(InternalCommandCodes.PutParameter, input)
         cmd.addArgument(Parameter(code, val))
         self.__controlWithoutResponse(cmd)
     def setParameterList(self, param, input):
@@ -728,14 +1077,11 @@ class ConfigurationChannel(ChannelBase):
         Returns:
             none
         """
-        cmd = Command(InternalCommandCodes.PutParameterList, input)
-        from SerializableObject import SerializableObject
-        from TypeCode import TypeCode
+        cmd = Command.acquire(InternalCommandCodes.PutParameterList, input)
         for p in param:
             if not isinstance(p, SerializableObject) or p.getType() != TypeCode.ParameterData:
                 raise InvalidArgumentException()
-
-            cmd.addArgument(p)
+        cmd.addArguments(param)
         self.__controlWithoutResponse(cmd)
     def getSCAdefinitions(self, input=1):
         """
@@ -754,11 +1100,7 @@ class ConfigurationChannel(ChannelBase):
         Returns:
             SCAdefinitions
         """
-        cmd = Command(InternalCommandCodes.GetSCAdefinitions, input)        
-        resp=self.__controlWithResponse(cmd)
-        if (isinstance(resp[0], SCAdefinitions) is False):
-            raise InvalidResponseException()
-        return resp[0]
+        return self.__controlWithTypedResponse(_getRequestMessage(InternalCommandCodes.GetSCAdefinitions, input, ()), SCAdefinitions)
     def setSCAdefinitions(self, defs, input=1):
         """
         Description:
@@ -777,7 +1119,7 @@ class ConfigurationChannel(ChannelBase):
         Returns:
             none
         """
-        cmd = Command(InternalCommandCodes.PutSCAdefinitions, input)
+        cmd = Command.acquire(InternalCommandCodes.PutSCAdefinitions, input)
         cmd.addArgument(defs)
         self.__controlWithoutResponse(cmd)        
     def getSCAbufferData(self, input=1):
@@ -797,11 +1139,7 @@ class ConfigurationChannel(ChannelBase):
         Returns:
             SCAdefinitions
         """
-        cmd = Command(InternalCommandCodes.GetSCAbuffer, input)    
-        resp=self.__controlWithResponse(cmd)
-        if (isinstance(resp[0], SCAbuffer) is False):
-            raise InvalidResponseException()
-        return resp[0]
+        return self.__controlWithTypedResponse(_getRequestMessage(InternalCommandCodes.GetSCAbuffer, input, ()), SCAbuffer)
     def setProperty(self, name, val):
         """
         Description:
@@ -813,7 +1151,8 @@ class ConfigurationChannel(ChannelBase):
         Returns:
             none
         """        
-        name = name.lower()
+        if (name.islower() is False):
+            name = name.lower()
         if ("port" == name):
             self.setPort(val)
         else:
@@ -830,7 +1169,8 @@ class ConfigurationChannel(ChannelBase):
         Returns:
             any                  The value
         """
-        name = name.lower()  
+        if (name.islower() is False):
+            name = name.lower()
         if ("port" == name):
             return self.getPort()      
         else:
@@ -1,14 +1,52 @@
 from SerializableObject import SerializableObject
 from TypeCode import TypeCode
-from Exceptions import UnsupportedCompressionException
+from Exceptions import UnsupportedCompressionException, SerializationException
 import ApplicationSerializer
 import datetime
+import struct
+try:
+    import numpy
+except ImportError:
+    # numpy is optional.  Attributes are held in a list without it
+    numpy = None
+
+#Number of samples (Short) and bytes per sample (Short)
+_S_HEADER = struct.Struct("<hh")
+#Sample start time (DateTime), elapsed time (Long) and number of counters
+_S_SAMPLE_WRITE = struct.Struct("<QQI")
+_S_SAMPLE_READ = struct.Struct("<qqi")
+_S_SAMPLE_TIMES = struct.Struct("<qq")
+
+#Compiled formats for a whole sample keyed by the number of counters.
+#The counter configuration rarely changes, so only a few are created
+_SAMPLE_STRUCTS = {}
+_SAMPLE_STRUCTS_MAX = 32
+
+def _getSampleStruct(count):
+    """
+    Description:
+        Returns the compiled format of a sample header
+        followed by count counter attributes
+    Arguments:
+        count    (in, int) The number of counters
+    Returns:
+        (struct.Struct) The compiled format
+    """
+    compiled = _SAMPLE_STRUCTS.get(count)
+    if (None == compiled):
+        if (len(_SAMPLE_STRUCTS) >= _SAMPLE_STRUCTS_MAX):
+            _SAMPLE_STRUCTS.clear()
+        compiled = _SAMPLE_STRUCTS[count] = struct.Struct("<QQI%dI" % (3*count))
+    return compiled
+
 class CounterAttribute(object):
     """
     Description:
         An instance of this class is used to encapsulate the
         attributes of a counter
     """
+    __slots__ = ('__corrVal', '__uncorrVal', '__flags')
+    DATA_SIZE = 3*4    #Uncorrected, corrected and flags (Uint)
     def __init__(self, corrVal=0, uncorrVal=0, flags=0):
         """
         Description:
@@ -62,7 +100,28 @@ class CounterAttribute(object):
         Returns:
             (int) The value
         """
-        return 3*4
+        return CounterAttribute.DATA_SIZE
+    def __getstate__(self):
+        """
+        Description:
+            Returns the state to pickle.  Needed because
+            this class has no __dict__
+        Arguments:
+            none
+        Returns:
+            (tuple) The state
+        """
+        return (self.__corrVal, self.__uncorrVal, self.__flags)
+    def __setstate__(self, state):
+        """
+        Description:
+            Restores the pickled state
+        Arguments:
+            state (in, tuple) The state
+        Returns:
+            none
+        """
+        (self.__corrVal, self.__uncorrVal, self.__flags) = state
     
 class CounterSample(object):
     """
@@ -70,20 +129,43 @@ class CounterSample(object):
         An instance of this class is used to encapsulate a
         sample from a counter
     """
-    def __init__(self, startTime=datetime.datetime.now(), elapsed=0, attr=[]):
+    __slots__ = ('__startTime', '__elapsed', '__attributes', '__values', '__raw')
+    def __init__(self, startTime=None, elapsed=0, attr=None, values=None, raw=None):
         """
         Description:
             Initializes this instance
         Arguments:
-            startTime (in, DateTime)            The start time
+            startTime (in, DateTime)            The start time.  Defaults
+                                                to the current time
             elapsed   (in, int)                 The elapsed time (uS)
-            attr      (in, CounterAttribute[])  The counter attributes
+            attr      (in, CounterAttribute[])  The counter attributes.
+                                                Defaults to a new empty list
+            values    (in, optional, int[] or numpy.ndarray) The counter attributes
+                      as (uncorrected, corrected, flags) triples.  Used instead
+                      of attr; the sequence is referenced, not copied
+            raw       (in, optional, bytes) The counter attributes as they
+                      are serialized.  Used instead of attr and values; they
+                      are only unpacked when requested
         Returns:
             none
         """
+        if (None == startTime):
+            startTime = datetime.datetime.now()
         self.__startTime = startTime
         self.__elapsed = elapsed
-        self.__attributes = attr
+        #The attributes are held as CounterAttribute objects, as one
+        #contiguous sequence of values or as the serialized bytes.  Each
+        #form is only created from the next when it is requested
+        self.__attributes = None
+        self.__values = None
+        self.__raw = None
+        if (None != raw):
+            self.__raw = raw
+        #Identity tests so numpy arrays are not compared element-wise
+        elif (values is not None):
+            self.__values = values
+        else:
+            self.__attributes = [] if (None == attr) else attr
     def getStartTime(self):
         """
         Description:
@@ -114,7 +196,78 @@ class CounterSample(object):
         Returns:
             (CounterAttributes[]) The value
         """
+        if (None == self.__attributes):
+            vals = self.getAttributeValues()
+            if ((None != numpy) and isinstance(vals, numpy.ndarray)):
+                vals = vals.ravel().tolist()
+            self.__attributes = [CounterAttribute(vals[i+1], vals[i], vals[i+2]) for i in range(0, len(vals), 3)]
+            self.__values = None
         return self.__attributes
+    def getAttributeValues(self):
+        """
+        Description:
+            Returns the counter attributes as one sequence of
+            (uncorrected, corrected, flags) triples without
+            creating a CounterAttribute per counter
+        Arguments:
+            none
+        Returns:
+            (int[] or numpy.ndarray) The value.  numpy arrays
+                                     have a shape of (counters, 3)
+        """
+        if (None != self.__raw):
+            raw = self.__raw
+            count = len(raw) // 4
+            if (CounterData.attributesAsNumpy and (None != numpy)):
+                [values, offset] = ApplicationSerializer.ApplicationSerializer.deserializeArrayFrom(raw, 0, TypeCode.Int, count, True)
+                values = values.reshape(-1, 3)
+            else:
+                [values, offset] = ApplicationSerializer.ApplicationSerializer.deserializeArrayFrom(raw, 0, TypeCode.Int, count)
+            self.__values = values
+            self.__raw = None
+        if (self.__values is not None):
+            return self.__values
+        values = []
+        for attr in self.__attributes:
+            values += (attr.getUncorrectedValue(), attr.getCorrectedValue(), attr.getFlags())
+        return values
+    def getNumberOfAttributes(self):
+        """
+        Description:
+            Returns the number of counter attributes
+        Arguments:
+            none
+        Returns:
+            (int) The value
+        """
+        if (None != self.__raw):
+            return len(self.__raw) // CounterAttribute.DATA_SIZE
+        if (self.__values is not None):
+            if ((None != numpy) and isinstance(self.__values, numpy.ndarray)):
+                return self.__values.size // 3
+            return len(self.__values) // 3
+        return len(self.__attributes)
+    def __getstate__(self):
+        """
+        Description:
+            Returns the state to pickle.  Attributes that were
+            received and never unpacked are pickled as bytes
+        Arguments:
+            none
+        Returns:
+            (tuple) The state
+        """
+        return (self.__startTime, self.__elapsed, self.__attributes, self.__values, self.__raw)
+    def __setstate__(self, state):
+        """
+        Description:
+            Restores the pickled state
+        Arguments:
+            state (in, tuple) The state
+        Returns:
+            none
+        """
+        (self.__startTime, self.__elapsed, self.__attributes, self.__values, self.__raw) = state
     def getDataSize(self):
         """
         Description:
@@ -125,35 +278,59 @@ class CounterSample(object):
         Returns:
             (int) The value
         """
-        size = 16
-        nAttrs = len(self.__attributes)
-        if (nAttrs > 0):
-            size += nAttrs*self.__attributes[0].getDataSize()
-        return size
+        return 16 + CounterAttribute.DATA_SIZE*self.getNumberOfAttributes()
     def serializeData(self, stream):
         """
         Description:
             Serializes the data in this instance into a
             stream
         Arguments:
-            stream (char[])  The stream to append to
+            stream (bytearray)  The stream to append to.  Other
+                                streams are copied into a bytearray
         Returns:
-            (char[]) The stream containing the serialized data
-        """
-        stream += ApplicationSerializer.ApplicationSerializer.serialize(self.__startTime, objTypeCode=TypeCode.DateTime)
-        stream += ApplicationSerializer.ApplicationSerializer.serialize(self.__elapsed, objTypeCode=TypeCode.Long)
-        stream += ApplicationSerializer.ApplicationSerializer.serialize(len(self.__attributes), objTypeCode=TypeCode.Uint)
-        for i in range(0, len(self.__attributes)):
-            stream += ApplicationSerializer.ApplicationSerializer.serialize(self.__attributes[i].getUncorrectedValue(), objTypeCode=TypeCode.Uint)
-            stream += ApplicationSerializer.ApplicationSerializer.serialize(self.__attributes[i].getCorrectedValue(), objTypeCode=TypeCode.Uint)
-            stream += ApplicationSerializer.ApplicationSerializer.serialize(self.__attributes[i].getFlags(), objTypeCode=TypeCode.Uint)
-        return stream
+            (bytearray) The stream containing the serialized data
+        """
+        #Append in place so each sample does not copy the stream
+        if (isinstance(stream, bytearray) is False):
+            stream = bytearray(stream)
+        #Received attributes that were never unpacked are passed through
+        values = self.__raw
+        if (values is not None):
+            count = len(values) // CounterAttribute.DATA_SIZE
+        else:
+            values = self.getAttributeValues()
+            count = len(values)
+            if ((None != numpy) and isinstance(values, numpy.ndarray)):
+                count = values.size
+            count //= 3
+        start = ApplicationSerializer.convertToLynxDate(self.__startTime)
+        elapsed = self.__elapsed & 0xFFFFFFFFFFFFFFFF
+        if (None != self.__raw):
+            stream += _S_SAMPLE_WRITE.pack(start, elapsed, count)
+            stream += values
+            return stream
+        if (isinstance(values, list)):
+            #The whole sample is packed with the format compiled for its
+            #counter count.  Signed values fall back to the coercing path
+            try:
+                stream += _getSampleStruct(count).pack(start, elapsed, count, *values)
+                return stream
+            except struct.error:
+                pass
+        #The fixed size fields are packed with one call
+        stream += _S_SAMPLE_WRITE.pack(start, elapsed, count & 0xFFFFFFFF)
+        #(uncorrected, corrected, flags) triples are packed in one call
+        return ApplicationSerializer.ApplicationSerializer.serializeArray(stream, TypeCode.Uint, values)
 class CounterData(SerializableObject):
     """
     Description:
         An instance of this class is used to encapsulate all
         counter data
     """
+    #When True and numpy is installed, the attribute values of received
+    #samples are returned as a (counters, 3) int32 numpy array instead of
+    #a list.  Samples without padding are then read in one numpy call
+    attributesAsNumpy = False
     def __init__(self):
         """
         Description:
@@ -175,6 +352,28 @@ class CounterData(SerializableObject):
             (CounterSample []) The value
         """
         return self.__samples
+    def __getstate__(self):
+        """
+        Description:
+            Returns the state to pickle
+        Arguments:
+            none
+        Returns:
+            (tuple) The state
+        """
+        #A tuple so the state is never empty; __setstate__ is skipped for empty states
+        return (self.__samples,)
+    def __setstate__(self, state):
+        """
+        Description:
+            Restores the pickled state
+        Arguments:
+            state (in, tuple) The state
+        Returns:
+            none
+        """
+        SerializableObject.__init__(self, TypeCode.CounterData)
+        (self.__samples,) = state
     def getDataSize(self):
         """
         Description:
@@ -185,29 +384,30 @@ class CounterData(SerializableObject):
         Returns:
             (int)    The value
         """
-        size = 4
-        nSamps = len(self.__samples)
-        if (nSamps > 0):
-            size += nSamps*self.__samples[0].getDataSize()
-        return size
+        samples = self.__samples
+        if (not samples):
+            return _S_HEADER.size
+        return _S_HEADER.size + len(samples)*samples[0].getDataSize()
     def serializeData(self, stream):
         """
         Description:
             Serializes all data contained in this instace into
             a stream
         Arguments:
-            stream (in, char [])    The stream to append to
+            stream (in, out, bytearray)    The stream to append to.  Other
+                                           streams are copied into a bytearray
         Returns:
-            char[]    The stream containing the results
-        """
-        numSamps = len(self.__samples)
-        stream += ApplicationSerializer.ApplicationSerializer.serialize(numSamps, objTypeCode=TypeCode.Short)
-        size=0
-        if (numSamps > 0):
-            size = self.__samples[0].getDataSize()
-        stream += ApplicationSerializer.ApplicationSerializer.serialize(size, objTypeCode=TypeCode.Short)
-        for i in range(0, numSamps):
-            stream = self.__samples[i].serializeData(stream)
+            bytearray    The stream containing the results
+        """
+        if (isinstance(stream, bytearray) is False):
+            stream = bytearray(stream)
+        samples = self.__samples
+        if (not samples):
+            stream += _S_HEADER.pack(0, 0)
+            return stream
+        stream += _S_HEADER.pack(len(samples), samples[0].getDataSize())
+        for sample in samples:
+            stream = sample.serializeData(stream)
         return stream
     def deserializeData(self, stream):
         """
@@ -217,35 +417,69 @@ class CounterData(SerializableObject):
         Arguments:
             stream (in, char [])    The stream to append to
         Returns:
-            char[]    The stream minus the deserialized data
+            memoryview    The stream minus the deserialized data
+        """
+        stream = memoryview(stream)
+        return stream[self.deserializeFrom(stream, 0):]
+    def deserializeFrom(self, stream, offset):
+        """
+        Description:
+            Deserializes the samples starting at the offset without
+            slicing the stream for every sample
+        Arguments:
+            stream (in, memoryview)    The stream containing the data
+            offset (in, int)           The offset of the data within the stream
+        Returns:
+            int    The offset following the deserialized data
         """
         self.__samples = []
-        [nSamp, stream] = ApplicationSerializer.ApplicationSerializer.deserialize(stream, TypeCode.Short)
-        [bytesPerSamp, stream] = ApplicationSerializer.ApplicationSerializer.deserialize(stream, TypeCode.Short)
-        for i in range(0, nSamp):
-            numRead=0;
-            numCnts=0;
-            attrs = []
-            if (bytesPerSamp > numRead): 
-                [start, stream] = ApplicationSerializer.ApplicationSerializer.deserialize(stream, TypeCode.DateTime)
-                numRead += 8
-            if (bytesPerSamp > numRead):
-                [elapsed, stream] = ApplicationSerializer.ApplicationSerializer.deserialize(stream, TypeCode.Long)
-                numRead += 8
-            if (bytesPerSamp > numRead):
-                [numCnts, stream] = ApplicationSerializer.ApplicationSerializer.deserialize(stream, TypeCode.Int)
-                numRead += 4 
-            for j in range(0, numCnts):
-                if (bytesPerSamp > numRead):
-                    [uVal, stream] = ApplicationSerializer.ApplicationSerializer.deserialize(stream, TypeCode.Int) 
-                    numRead += 4
-                    [val, stream] = ApplicationSerializer.ApplicationSerializer.deserialize(stream, TypeCode.Int)
-                    numRead += 4
-                    [flags, stream] = ApplicationSerializer.ApplicationSerializer.deserialize(stream, TypeCode.Int)
-                    numRead += 4
-                    attrs.append(CounterAttribute(val, uVal, flags))          
-            samp=CounterSample(start, elapsed, attrs)
-            if (bytesPerSamp > numRead):
-                stream = stream[(bytesPerSamp-numRead):]
-            self.__samples.append(samp)
-        return stream
\ No newline at end of file
+        [nSamp, bytesPerSamp] = _S_HEADER.unpack_from(stream, offset)
+        offset += _S_HEADER.size
+        if (nSamp <= 0):
+            return offset
+        convertToLocalDate = ApplicationSerializer.convertToLocalDate
+        samples = self.__samples
+        #The sample size is validated once instead of before every field
+        if (bytesPerSamp <= _S_SAMPLE_TIMES.size):
+            if (bytesPerSamp <= 8):
+                raise SerializationException('Counter sample size too small: %d'%bytesPerSamp)
+            #The samples hold the start and elapsed times but no counters
+            unpackTimes = _S_SAMPLE_TIMES.unpack_from
+            for _ in range(nSamp):
+                [start, elapsed] = unpackTimes(stream, offset)
+                samples.append(CounterSample(convertToLocalDate(start), elapsed, raw=b''))
+                offset += bytesPerSamp
+            return offset
+        attrSize = CounterAttribute.DATA_SIZE
+        headerSize = _S_SAMPLE_READ.size
+        #Attributes are read while the sample size has not been reached
+        maxAttrs = max(0, (bytesPerSamp - headerSize + attrSize - 1) // attrSize)
+        unpackHeader = _S_SAMPLE_READ.unpack_from
+        streamSize = len(stream)
+        if (CounterData.attributesAsNumpy and (None != numpy) and (maxAttrs > 0)
+                and (headerSize + maxAttrs*attrSize == bytesPerSamp)
+                and (streamSize - offset >= nSamp*bytesPerSamp)):
+            #Every sample is exactly bytesPerSamp bytes, so all of them are
+            #read as one structured array and the attributes view its rows
+            rows = numpy.frombuffer(stream, numpy.dtype({'names': ['start', 'elapsed', 'count', 'attrs'],
+                                                         'formats': ['<i8', '<i8', '<i4', ('<i4', (maxAttrs, 3))],
+                                                         'offsets': [0, 8, 16, headerSize],
+                                                         'itemsize': bytesPerSamp}), nSamp, offset)
+            starts = ApplicationSerializer.convertToLocalDateArray(rows['start'])
+            elapsed = rows['elapsed'].tolist()
+            counts = numpy.clip(rows['count'], 0, maxAttrs).tolist()
+            attrs = rows['attrs']
+            for i in range(nSamp):
+                samples.append(CounterSample(starts[i], elapsed[i], values=attrs[i, :counts[i]]))
+            return offset + nSamp*bytesPerSamp
+        for _ in range(nSamp):
+            [start, elapsed, numCnts] = unpackHeader(stream, offset)
+            numAttrs = max(0, min(numCnts, maxAttrs))
+            attrStart = offset + headerSize
+            attrEnd = attrStart + attrSize*numAttrs
+            if (attrEnd > streamSize):
+                raise SerializationException('Counter data is truncated')
+            #The attributes are copied out as bytes and only unpacked on request
+            samples.append(CounterSample(convertToLocalDate(start), elapsed, raw=stream[attrStart:attrEnd].tobytes()))
+            offset = max(offset + bytesPerSamp, attrEnd)
+        return offset
@@ -1,18 +1,35 @@
 from ConfigurationChannel import ConfigurationChannel
 from ParameterTypes import DataTypes
 from IDevice import IDevice
+import operator
+import contextlib
 
-import sys
-if (sys.version_info > (3, 0)):
-    import _thread as thread
-else:
-    import thread
+#The configuration channel methods Device forwards to.  Each one is bound
+#once per Device and kept in a slot named after it
+_CHANNEL_METHODS = (
+    'getPort', 'setPort', 'getSpectrum', 'getSpectrumList', 'getMany',
+    'setSpectrum', 'getMSSData', 'getDsoData', 'getSpectralData',
+    'getSpectralDataList', 'getCounterData', 'getListData', 'control',
+    'lock', 'unlock', 'addUser', 'updateUser', 'deleteUser',
+    'enumerateUsers', 'validateUser', 'save', 'open', 'close', 'pipeline',
+    'getRegionsOfInterest', 'setRegionsOfInterest',
+    'getParameterAttributes', 'getParameter', 'getParameterList',
+    'setParameter', 'setParameterList', 'getIsOpen', 'getSCAdefinitions',
+    'setSCAdefinitions', 'getSCAbufferData', 'setProperty', 'getProperty'
+)
 
 class Device(IDevice):
     """
     Description:
         An instance of this class is used communicate with a Lynx.
+        The methods are thread safe; the configuration channel
+        serializes the requests.  Requests for different inputs
+        are still serialized because they share the single
+        configuration connection; use one Device per thread and
+        connection to poll inputs in parallel
     """
+    #__weakref__ allows DeviceFactory.createSharedInstance to track instances
+    __slots__ = ('__configChannel', '__weakref__') + tuple('_Device__' + name for name in _CHANNEL_METHODS)
     def __init__(self):
         """
         Description:
@@ -23,7 +40,9 @@ class Device(IDevice):
             none
         """ 
         self.__configChannel = ConfigurationChannel()
-        self.__lock = thread.allocate_lock()
+        #The channel is never replaced so its methods are bound once
+        for name in _CHANNEL_METHODS:
+            setattr(self, '_Device__' + name, getattr(self.__configChannel, name))
     def getPort(self):
         """
         Description:
@@ -33,11 +52,7 @@ class Device(IDevice):
         Returns:
             int    The value
         """
-        try:
-            self.__lock.acquire()
-            return self.__configChannel.getPort()
-        finally:
-            self.__lock.release()            
+        return self.__getPort()
     def setPort(self, val):
         """
         Description:
@@ -47,11 +62,7 @@ class Device(IDevice):
         Returns:
             none
         """
-        try:
-            self.__lock.acquire()
-            self.__configChannel.setPort(val)
-        finally:
-            self.__lock.release()     
+        self.__setPort(val)
     def getSpectrum(self, input, group=1):
         """
         Description:
@@ -71,11 +82,49 @@ class Device(IDevice):
         Returns:
             Spectrum
         """
-        try:
-            self.__lock.acquire()
-            return self.__configChannel.getSpectrum(input, group)
-        finally:
-            self.__lock.release()
+        return self.__getSpectrum(input, group)
+    def getSpectrumList(self, inputs, group=1):
+        """
+        Description:
+            This method will get the spectrum from several
+            inputs with a single round trip to the device
+        Arguments:
+            inputs (in, int[])  The inputs
+            group (in, int)     The memory group
+        Exceptions:
+            ChecksumException
+            DigitalSignatureException
+            InvalidResponseException
+            MessageVersionException
+            SerializationException
+            UnsupportedCompressionException
+            UnsupportedTypeException
+        Returns:
+            Spectrum[]          The spectra in the order of the inputs
+        """
+        return self.__getSpectrumList(inputs, group)
+    def getMany(self, requests):
+        """
+        Description:
+            This method will execute several getters with a single
+            round trip to the device.  See ConfigurationChannel.getMany
+        Arguments:
+            requests (in, (string, tuple)[]) The name of each getter and
+                                             its arguments, for example
+                                             ('getSpectralData', (1,))
+        Exceptions:
+            ChecksumException
+            DigitalSignatureException
+            InvalidArgumentException
+            InvalidResponseException
+            MessageVersionException
+            SerializationException
+            UnsupportedCompressionException
+            UnsupportedTypeException
+        Returns:
+            any[]               The result of each getter, in order
+        """
+        return self.__getMany(requests)
     def setSpectrum(self, data, input, group=1):
         """
         Description:
@@ -96,11 +145,7 @@ class Device(IDevice):
         Returns:
             none
         """
-        try:
-            self.__lock.acquire()
-            self.__configChannel.setSpectrum(data, input, group)
-        finally:
-            self.__lock.release()
+        self.__setSpectrum(data, input, group)
     def getMSSData(self, input=1):
         """
         Description:
@@ -119,11 +164,7 @@ class Device(IDevice):
         Returns:
             PhaData[]
         """
-        try:
-            self.__lock.acquire()
-            return self.__configChannel.getMSSData(input)
-        finally:
-            self.__lock.release()
+        return self.__getMSSData(input)
     def getDsoData(self, input=1):
         """
         Description:
@@ -142,11 +183,7 @@ class Device(IDevice):
         Returns:
             DigitalOscilloscopeData
         """
-        try:
-            self.__lock.acquire()
-            return self.__configChannel.getDsoData(input)
-        finally:
-            self.__lock.release()
+        return self.__getDsoData(input)
     def getSpectralData(self, input, group=1):
         """
         Description:
@@ -168,11 +205,27 @@ class Device(IDevice):
         Returns:
             SpectralData
         """
-        try:
-            self.__lock.acquire()
-            return self.__configChannel.getSpectralData(input, group)
-        finally:
-            self.__lock.release()
+        return self.__getSpectralData(input, group)
+    def getSpectralDataList(self, inputs, group=1):
+        """
+        Description:
+            This method will get spectral data from several
+            inputs with a single round trip to the device
+        Arguments:
+            inputs (in, int[])  The inputs
+            group (in, int)     The group
+        Exceptions:
+            ChecksumException
+            DigitalSignatureException
+            InvalidResponseException
+            MessageVersionException
+            SerializationException
+            UnsupportedCompressionException
+            UnsupportedTypeException
+        Returns:
+            SpectralData[]      The data in the order of the inputs
+        """
+        return self.__getSpectralDataList(inputs, group)
     def getCounterData(self, input=1):
         """
         Description:
@@ -191,11 +244,7 @@ class Device(IDevice):
         Returns:
             CounterData
         """
-        try:
-            self.__lock.acquire()
-            return self.__configChannel.getCounterData(input)
-        finally:
-            self.__lock.release()
+        return self.__getCounterData(input)
     def getListData(self, input=1):
         """
         Description:
@@ -213,11 +262,7 @@ class Device(IDevice):
         Returns:
             ListDataBase
         """
-        try:
-            self.__lock.acquire()
-            return self.__configChannel.getListData(input)
-        finally:
-            self.__lock.release()
+        return self.__getListData(input)
     def control(self, code, input, args=None):
         """
         Description:
@@ -237,11 +282,7 @@ class Device(IDevice):
         Returns:
             none
         """
-        try:
-            self.__lock.acquire()
-            return self.__configChannel.control(code, input, args)
-        finally:
-            self.__lock.release()   
+        return self.__control(code, input, args)
 
     def lock(self, usr, pwd, input):
         """
@@ -262,11 +303,7 @@ class Device(IDevice):
         Returns:
             none
         """
-        try:
-            self.__lock.acquire()
-            self.__configChannel.lock(usr, pwd, input)
-        finally:
-            self.__lock.release()   
+        self.__lock(usr, pwd, input)
     def unlock(self, usr, pwd, input):
         """
         Description:
@@ -286,11 +323,7 @@ class Device(IDevice):
         Returns:
             none
         """
-        try:
-            self.__lock.acquire()
-            self.__configChannel.unlock(usr, pwd, input)
-        finally:
-            self.__lock.release() 
+        self.__unlock(usr, pwd, input)
     def addUser(self, usr, pwd, desc, attr):
         """
         Description:
@@ -311,11 +344,7 @@ class Device(IDevice):
         Returns:
             none
         """
-        try:
-            self.__lock.acquire()
-            self.__configChannel.addUser(usr, pwd, desc, attr)
-        finally:
-            self.__lock.release() 
+        self.__addUser(usr, pwd, desc, attr)
     def updateUser(self, usr, pwd, desc, attr):
         """
         Description:
@@ -336,11 +365,7 @@ class Device(IDevice):
         Returns:
             none
         """
-        try:
-            self.__lock.acquire()
-            self.__configChannel.updateUser(usr, pwd, desc, attr)
-        finally:
-            self.__lock.release()
+        self.__updateUser(usr, pwd, desc, attr)
     def deleteUser(self, usr):
         """
         Description:
@@ -358,11 +383,7 @@ class Device(IDevice):
         Returns:
             none
         """
-        try:
-            self.__lock.acquire()
-            self.__configChannel.deleteUser(usr)
-        finally:
-            self.__lock.release()
+        self.__deleteUser(usr)
     def enumerateUsers(self):
         """
         Description:
@@ -380,11 +401,7 @@ class Device(IDevice):
         Returns:
             string[]    
         """
-        try:
-            self.__lock.acquire()
-            return self.__configChannel.enumerateUsers()
-        finally:
-            self.__lock.release()
+        return self.__enumerateUsers()
     def validateUser(self, usr, pwd):
         """
         Description:
@@ -403,11 +420,7 @@ class Device(IDevice):
         Returns:
             none
         """
-        try:
-            self.__lock.acquire()
-            return self.__configChannel.validateUser(usr, pwd)
-        finally:
-            self.__lock.release()
+        return self.__validateUser(usr, pwd)
     def save(self, input, group):
         """
         Description:
@@ -427,11 +440,7 @@ class Device(IDevice):
         Returns:
             string    The file name
         """
-        try:
-            self.__lock.acquire()
-            return self.__configChannel.save(input, group)
-        finally:
-            self.__lock.release()
+        return self.__save(input, group)
     def open(self, localAddr, devAddr):
         """
         Description:
@@ -445,11 +454,7 @@ class Device(IDevice):
         Returns:
             none
         """
-        try:
-            self.__lock.acquire()
-            self.__configChannel.open(localAddr, devAddr)
-        finally:
-            self.__lock.release()
+        self.__open(localAddr, devAddr)
     def close(self):
         """
         Description:
@@ -459,11 +464,27 @@ class Device(IDevice):
         Returns:
             none
         """
-        try:
-            self.__lock.acquire()
-            self.__configChannel.close()
-        finally:
-            self.__lock.release()
+        self.__close()
+    def pipeline(self):
+        """
+        Description:
+            Returns a context manager that queues the commands
+            which do not return data (setParameter, lock, control,
+            ...) and sends them as one transmission when the block
+            exits.  Use this to batch configuration changes.  See
+            ConfigurationChannel.pipeline
+        Arguments:
+            none
+        Exceptions:
+            DeviceErrorException    The first error returned by
+                                    any of the queued commands
+            InvalidResponseException
+        Returns:
+            context manager         Yields this instance
+        """
+        with self.__pipeline():
+            yield self
+    pipeline = contextlib.contextmanager(pipeline)
     def getRegionsOfInterest(self, input):
         """
         Description:
@@ -481,11 +502,7 @@ class Device(IDevice):
         Returns:
             RegionOfInterest[]
         """
-        try:
-            self.__lock.acquire()
-            return self.__configChannel.getRegionsOfInterest(input)
-        finally:
-            self.__lock.release()
+        return self.__getRegionsOfInterest(input)
     def setRegionsOfInterest(self, rgns, input):
         """
         Description:
@@ -504,11 +521,7 @@ class Device(IDevice):
         Returns:
             none
         """
-        try:
-            self.__lock.acquire()
-            self.__configChannel.setRegionsOfInterest(rgns, input)
-        finally:
-            self.__lock.release()
+        self.__setRegionsOfInterest(rgns, input)
     def getParameterAttributes(self, code, input):
         """
         Description:
@@ -529,11 +542,7 @@ class Device(IDevice):
         Returns:
             ParameterAttributes
         """
-        try:
-            self.__lock.acquire()
-            return self.__configChannel.getParameterAttributes(code, input)
-        finally:
-            self.__lock.release()
+        return self.__getParameterAttributes(code, input)
     def getParameter(self, code, input):
         """
         Description:
@@ -552,11 +561,7 @@ class Device(IDevice):
         Returns:
             any
         """
-        try:
-            self.__lock.acquire()
-            return self.__configChannel.getParameter(code, input)
-        finally:
-            self.__lock.release()
+        return self.__getParameter(code, input)
     def getParameterList(self, code, input):
         """
         Description:
@@ -575,11 +580,7 @@ class Device(IDevice):
         Returns:
             any[]
         """
-        try:
-            self.__lock.acquire()
-            return self.__configChannel.getParameterList(code, input)
-        finally:
-            self.__lock.release()
+        return self.__getParameterList(code, input)
     def setParameter(self, code, val, input):
         """
         Description:
@@ -599,11 +600,7 @@ class Device(IDevice):
         Returns:
             none
         """
-        try:
-            self.__lock.acquire()
-            self.__configChannel.setParameter(code, val, input)
-        finally:
-            self.__lock.release()
+        self.__setParameter(code, val, input)
     def setParameterList(self, params, input):
         """
         Description:
@@ -622,11 +619,7 @@ class Device(IDevice):
         Returns:
             none
         """
-        try:
-            self.__lock.acquire()
-            self.__configChannel.setParameterList(params, input)
-        finally:
-            self.__lock.release()
+        self.__setParameterList(params, input)
     def getIsOpen(self):
         """
         Description:
@@ -636,11 +629,7 @@ class Device(IDevice):
         Returns:
             bool
         """
-        try:
-            self.__lock.acquire()
-            return self.__configChannel.getIsOpen()
-        finally:
-            self.__lock.release() 
+        return self.__getIsOpen()
     def getSCAdefinitions(self, input=1):
         """
         Description:
@@ -658,11 +647,7 @@ class Device(IDevice):
         Returns:
             SCAdefinitions
         """
-        try:
-            self.__lock.acquire()
-            return self.__configChannel.getSCAdefinitions(input)
-        finally:
-            self.__lock.release() 
+        return self.__getSCAdefinitions(input)
     def setSCAdefinitions(self, defs, input):
         """
         Description:
@@ -681,11 +666,7 @@ class Device(IDevice):
         Returns:
             none
         """
-        try:
-            self.__lock.acquire()
-            self.__configChannel.setSCAdefinitions(defs, input)
-        finally:
-            self.__lock.release()      
+        self.__setSCAdefinitions(defs, input)
     def getSCAbufferData(self, input=1):
         """
         Description:
@@ -703,11 +684,12 @@ class Device(IDevice):
         Returns:
             SCAdefinitions
         """
-        try:
-            self.__lock.acquire()
-            return self.__configChannel.getSCAbufferData(input)
-        finally:
-            self.__lock.release()    
+        return self.__getSCAbufferData(input)
+    #The bound channel getter used by getData for each data type
+    _DISPATCH = {DataTypes.counterData: operator.attrgetter('_Device__getCounterData'),
+                 DataTypes.listData: operator.attrgetter('_Device__getListData'),
+                 DataTypes.scaBufferData: operator.attrgetter('_Device__getSCAbufferData'),
+                 DataTypes.mssData: operator.attrgetter('_Device__getMSSData')}
     def getData(self, dataType, input=1):
         """
         Description:
@@ -727,19 +709,10 @@ class Device(IDevice):
         Returns:
             object
         """
-        try:
-            self.__lock.acquire()
-            if (DataTypes.counterData == dataType):
-                return self.getCounterData(input)
-            elif (DataTypes.listData == dataType):
-                return self.getListData(input)
-            elif (DataTypes.scaBufferData == dataType):
-                return self.getSCAbufferData(input)
-            elif (DataTypes.mssData == dataType):
-                return self.getMSSData(input)
+        getter = self._DISPATCH.get(dataType)
+        if (None == getter):
             return None
-        finally:
-            self.__lock.release()
+        return getter(self)(input)
     def setProperty(self, name, val):
         """
         Description:
@@ -753,7 +726,7 @@ class Device(IDevice):
         """
         #The locking has been removed intentionally
         #sync locks are handled lower
-        self.__configChannel.setProperty(name, val)
+        self.__setProperty(name, val)
         
     def getProperty(self, name):
         """
@@ -767,5 +740,5 @@ class Device(IDevice):
         """
         #The locking has been removed intentionally
         #sync locks are handled lower            
-        return self.__configChannel.getProperty(name)
+        return self.__getProperty(name)
 
@@ -1,4 +1,5 @@
 from Device import Device
+import weakref
 
 class DeviceFactory(object):
     """
@@ -15,18 +16,41 @@ class DeviceFactory(object):
         """
         IDevice = 0
            
+    #The class created for each interface type
+    _FACTORY = {DeviceInterface.IDevice: Device}
+    #The shared instance of each interface type, kept while referenced
+    _SHARED = weakref.WeakValueDictionary()
     def _createInstance(cls, interfaceType):
         """
         Description:
-            This method will return the socket port
+            This method will create a new instance of an interface
         Arguments:
-            none
-        Returns:
             interfaceType (int)    The type of interface to create
+        Returns:
+            IDevice    The instance or None if the type is unknown
         """
-        if (DeviceFactory.DeviceInterface.IDevice == interfaceType):
-            return Device()
-        else:
+        factory = cls._FACTORY.get(interfaceType)
+        if (None == factory):
             return None
+        return factory()
         
-    createInstance = classmethod(_createInstance)
\ No newline at end of file
+    createInstance = classmethod(_createInstance)
+
+    def _createSharedInstance(cls, interfaceType):
+        """
+        Description:
+            This method will return the instance of an interface shared
+            by all callers, creating it when no caller still references it
+        Arguments:
+            interfaceType (int)    The type of interface to create
+        Returns:
+            IDevice    The instance or None if the type is unknown
+        """
+        instance = cls._SHARED.get(interfaceType)
+        if (None == instance):
+            instance = cls.createInstance(interfaceType)
+            if (None != instance):
+                cls._SHARED[interfaceType] = instance
+        return instance
+
+    createSharedInstance = classmethod(_createSharedInstance)
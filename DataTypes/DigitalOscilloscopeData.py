@@ -54,37 +54,37 @@ class DigitalOscilloscopeData(SerializableObject):
         Returns:
             char[]    The stream containing the results
         """
-        stream += ApplicationSerializer.ApplicationSerializer.serialize(self.__data.startTime, objTypeCode=TypeCode.DateTime)
+        stream = ApplicationSerializer.ApplicationSerializer.serialize(self.__data.startTime, stream, objTypeCode=TypeCode.DateTime)
         size = 36 #29+3
-        stream += ApplicationSerializer.ApplicationSerializer.serialize(size, objTypeCode=TypeCode.Uint)
-        stream += ApplicationSerializer.ApplicationSerializer.serialize(self.__data.captureInterval, objTypeCode=TypeCode.Uint)
-        stream += ApplicationSerializer.ApplicationSerializer.serialize(self.__data.sampleRate, objTypeCode=TypeCode.Uint)
-        stream += ApplicationSerializer.ApplicationSerializer.serialize(self.__data.averageSweeps, objTypeCode=TypeCode.Uint)
-        stream += ApplicationSerializer.ApplicationSerializer.serialize(self.__data.flags, objTypeCode=TypeCode.Uint)
-        stream += ApplicationSerializer.ApplicationSerializer.serialize(self.__data.analogSignalMask, objTypeCode=TypeCode.Uint)
+        stream = ApplicationSerializer.ApplicationSerializer.serialize(size, stream, objTypeCode=TypeCode.Uint)
+        stream = ApplicationSerializer.ApplicationSerializer.serialize(self.__data.captureInterval, stream, objTypeCode=TypeCode.Uint)
+        stream = ApplicationSerializer.ApplicationSerializer.serialize(self.__data.sampleRate, stream, objTypeCode=TypeCode.Uint)
+        stream = ApplicationSerializer.ApplicationSerializer.serialize(self.__data.averageSweeps, stream, objTypeCode=TypeCode.Uint)
+        stream = ApplicationSerializer.ApplicationSerializer.serialize(self.__data.flags, stream, objTypeCode=TypeCode.Uint)
+        stream = ApplicationSerializer.ApplicationSerializer.serialize(self.__data.analogSignalMask, stream, objTypeCode=TypeCode.Uint)
 
-        stream += ApplicationSerializer.ApplicationSerializer.serialize(self.__data.trigger.level, objTypeCode=TypeCode.Ushort)
-        stream += ApplicationSerializer.ApplicationSerializer.serialize(self.__data.trigger.numPreTriggerSamples, objTypeCode=TypeCode.Ushort)
-        stream += ApplicationSerializer.ApplicationSerializer.serialize(self.__data.trigger.numPostTriggerSamples, objTypeCode=TypeCode.Ushort)
-        stream += ApplicationSerializer.ApplicationSerializer.serialize(self.__data.trigger.mode, objTypeCode=TypeCode.Ubyte)
-        stream += ApplicationSerializer.ApplicationSerializer.serialize(self.__data.trigger.source, objTypeCode=TypeCode.Ubyte)
-        stream += ApplicationSerializer.ApplicationSerializer.serialize(self.__data.trigger.slope, objTypeCode=TypeCode.Ubyte)
+        stream = ApplicationSerializer.ApplicationSerializer.serialize(self.__data.trigger.level, stream, objTypeCode=TypeCode.Ushort)
+        stream = ApplicationSerializer.ApplicationSerializer.serialize(self.__data.trigger.numPreTriggerSamples, stream, objTypeCode=TypeCode.Ushort)
+        stream = ApplicationSerializer.ApplicationSerializer.serialize(self.__data.trigger.numPostTriggerSamples, stream, objTypeCode=TypeCode.Ushort)
+        stream = ApplicationSerializer.ApplicationSerializer.serialize(self.__data.trigger.mode, stream, objTypeCode=TypeCode.Ubyte)
+        stream = ApplicationSerializer.ApplicationSerializer.serialize(self.__data.trigger.source, stream, objTypeCode=TypeCode.Ubyte)
+        stream = ApplicationSerializer.ApplicationSerializer.serialize(self.__data.trigger.slope, stream, objTypeCode=TypeCode.Ubyte)
         
         if True:
-            stream += ApplicationSerializer.ApplicationSerializer.serialize(0, objTypeCode=TypeCode.Ubyte)
-            stream += ApplicationSerializer.ApplicationSerializer.serialize(0, objTypeCode=TypeCode.Ubyte)
-            stream += ApplicationSerializer.ApplicationSerializer.serialize(0, objTypeCode=TypeCode.Ubyte)
+            stream = ApplicationSerializer.ApplicationSerializer.serialize(0, stream, objTypeCode=TypeCode.Ubyte)
+            stream = ApplicationSerializer.ApplicationSerializer.serialize(0, stream, objTypeCode=TypeCode.Ubyte)
+            stream = ApplicationSerializer.ApplicationSerializer.serialize(0, stream, objTypeCode=TypeCode.Ubyte)
 
-        stream += ApplicationSerializer.ApplicationSerializer.serialize(len(self.__data.samples), objTypeCode=TypeCode.Ushort)
+        stream = ApplicationSerializer.ApplicationSerializer.serialize(len(self.__data.samples), stream, objTypeCode=TypeCode.Ushort)
         
         numBytesPer = (1 + len(self.__data.samples[0].analogSignals))*2
-        stream += ApplicationSerializer.ApplicationSerializer.serialize(numBytesPer, objTypeCode=TypeCode.Ushort)
+        stream = ApplicationSerializer.ApplicationSerializer.serialize(numBytesPer, stream, objTypeCode=TypeCode.Ushort)
         for sample in self.__data.samples:
             digital = sample.digitalSignals
             digital = int("".join(str(x) for x in digital[:8]), 2) 
-            stream += ApplicationSerializer.ApplicationSerializer.serialize(digital, objTypeCode=TypeCode.Ushort)
+            stream = ApplicationSerializer.ApplicationSerializer.serialize(digital, stream, objTypeCode=TypeCode.Ushort)
             for analog in sample.analogSignals:
-                stream += ApplicationSerializer.ApplicationSerializer.serialize(analog, objTypeCode=TypeCode.Ushort)
+                stream = ApplicationSerializer.ApplicationSerializer.serialize(analog, stream, objTypeCode=TypeCode.Ushort)
         return stream
     def deserializeData(self, stream):
         """
@@ -43,7 +43,7 @@ class DigitalSignature(Serializable):
             none
         """
         pass
-    def serialize(self, stream=b''):
+    def serialize(self, stream=None):
         """
         Description:
             Serializes the data into the stream
@@ -52,11 +52,13 @@ class DigitalSignature(Serializable):
         Returns:
             char[]    The serialized data and any addition info supplied in the stream
         """
+        if (None == stream):
+            stream = bytearray()
         stream+=ApplicationSerializer.ApplicationSerializer.serialize(len(self._Key))
         stream+=ApplicationSerializer.ApplicationSerializer.serialize(len(self._Signature))
         stream+=ApplicationSerializer.ApplicationSerializer.serialize(len(self._RandomData))
         for v in self._RandomData:
-            stream+=ApplicationSerializer.ApplicationSerializer.serialize(v, TypeCode.Byte)
+            stream+=ApplicationSerializer.ApplicationSerializer.serialize(v, objTypeCode=TypeCode.Byte)
         return stream
     def deserialize(self, stream):
         """
@@ -71,7 +73,7 @@ class DigitalSignature(Serializable):
         [self._Key, stream] = ApplicationSerializer.ApplicationSerializer.deserialize(stream, TypeCode.Int)
         [self._Signature, stream] = ApplicationSerializer.ApplicationSerializer.deserialize(stream, TypeCode.Int)
         [length, stream] = ApplicationSerializer.ApplicationSerializer.deserialize(stream, TypeCode.Int)
-        for i in range(0, length):
+        for _ in range(length):
             [v, stream] = ApplicationSerializer.ApplicationSerializer.deserialize(stream, TypeCode.Byte)
             self._RandomData.append(v)
         return stream
@@ -85,11 +85,11 @@ class DlfcData(SpectralData):
         Returns:
             char[]    The stream containing the results
         """
-        stream += ApplicationSerializer.ApplicationSerializer.serialize(self.__liveTime, objTypeCode=TypeCode.Long)
-        stream += ApplicationSerializer.ApplicationSerializer.serialize(self.__realTime, objTypeCode=TypeCode.Long)
-        stream += ApplicationSerializer.ApplicationSerializer.serialize(self.__compValue, objTypeCode=TypeCode.Long)
+        stream = ApplicationSerializer.ApplicationSerializer.serialize(self.__liveTime, stream, objTypeCode=TypeCode.Long)
+        stream = ApplicationSerializer.ApplicationSerializer.serialize(self.__realTime, stream, objTypeCode=TypeCode.Long)
+        stream = ApplicationSerializer.ApplicationSerializer.serialize(self.__compValue, stream, objTypeCode=TypeCode.Long)
         stream = SpectralData.serializeData(self, stream)
-        stream += self.__corrSpectrum.serialize()
+        stream = self.__corrSpectrum.serialize(stream)
         return stream
     def deserializeData(self, stream):
         """
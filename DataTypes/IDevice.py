@@ -4,12 +4,16 @@ class IDevice(object):
         This is the interface necessary for communicating with the
         Lynx.
     """
+    __slots__ = ()
     def getPort(self): None                
     def setPort(self, val): None        
     def getSpectrum(self, input, group=1): None        
+    def getSpectrumList(self, inputs, group=1): None
+    def getMany(self, requests): None
     def setSpectrum(self, data, input, group=1): None        
     def getMSSData(self, input=1): None        
     def getSpectralData(self, input, group=1): None        
+    def getSpectralDataList(self, inputs, group=1): None
     def getCounterData(self, input=1): None        
     def getListData(self, input=1): None        
     def control(self, code, input): None        
@@ -23,6 +27,7 @@ class IDevice(object):
     def save(self, input, group): None        
     def open(self, localAddr, devAddr): None        
     def close(self): None        
+    def pipeline(self): None
     def getRegionsOfInterest(self, input): None        
     def setRegionsOfInterest(self, rgns, input): None        
     def getParameterAttributes(self, code, input): None        
@@ -99,7 +99,7 @@ class ListDataBase(SerializableObject):
             (int)    The value
         """
         return 3*8 + 3*4        
-    def serializeData(self, stream=b''):
+    def serializeData(self, stream=None):
         """
         Description:
             Serializes all data contained in this instace into
@@ -109,11 +109,13 @@ class ListDataBase(SerializableObject):
         Returns:
             char[]    The stream containing the results
         """
-        stream += ApplicationSerializer.ApplicationSerializer.serialize(self.__startTime)
-        stream += ApplicationSerializer.ApplicationSerializer.serialize(self.__realTime, objTypeCode=TypeCode.Long)
-        stream += ApplicationSerializer.ApplicationSerializer.serialize(self.__liveTime, objTypeCode=TypeCode.Long)
-        stream += ApplicationSerializer.ApplicationSerializer.serialize(self.__timeBase, objTypeCode=TypeCode.Int)
-        stream += ApplicationSerializer.ApplicationSerializer.serialize(self.__flags, objTypeCode=TypeCode.Int)
+        if (None == stream):
+            stream = bytearray()
+        stream = ApplicationSerializer.ApplicationSerializer.serialize(self.__startTime, stream)
+        stream = ApplicationSerializer.ApplicationSerializer.serialize(self.__realTime, stream, objTypeCode=TypeCode.Long)
+        stream = ApplicationSerializer.ApplicationSerializer.serialize(self.__liveTime, stream, objTypeCode=TypeCode.Long)
+        stream = ApplicationSerializer.ApplicationSerializer.serialize(self.__timeBase, stream, objTypeCode=TypeCode.Int)
+        stream = ApplicationSerializer.ApplicationSerializer.serialize(self.__flags, stream, objTypeCode=TypeCode.Int)
         return stream
     def deserializeData(self, stream):
         """
@@ -169,7 +171,7 @@ class ListData(ListDataBase):
             (int)    The value
         """
         return ListDataBase.getDataSize(self) + len(self.__events)*2
-    def serializeData(self, stream=b''):
+    def serializeData(self, stream=None):
         """
         Description:
             Serializes all data contained in this instace into
@@ -179,10 +181,9 @@ class ListData(ListDataBase):
         Returns:
             char[]    The stream containing the results
         """
-        stream += ListDataBase.serializeData(self)
-        stream += ApplicationSerializer.ApplicationSerializer.serialize(len(self.__events), objTypeCode=TypeCode.Int)
-        for event in self.__events:                    
-            stream += ApplicationSerializer.ApplicationSerializer.serialize(event, objTypeCode=TypeCode.Ushort)
+        stream = ListDataBase.serializeData(self, stream)
+        stream = ApplicationSerializer.ApplicationSerializer.serialize(len(self.__events), stream, objTypeCode=TypeCode.Int)
+        stream = ApplicationSerializer.ApplicationSerializer.serializeArray(stream, TypeCode.Ushort, self.__events)
         return stream
     def deserializeData(self, stream):
         """
@@ -196,15 +197,12 @@ class ListData(ListDataBase):
         Returns:
             char[]    The stream minus the deserialized data
         """
-        self.__events = []
         stream = ListDataBase.deserializeData(self, stream)
         version = ((self.getFlags()&(ListMasks.ListVersionMask)) >> 16)
         if (version != 0):
             raise DeviceErrorException(ListDataBase.DSA3K_UNSUPPORTED_LISTFORMAT)
         [numEvents, stream] = ApplicationSerializer.ApplicationSerializer.deserialize(stream, TypeCode.Int)
-        for i in range(0, numEvents):
-            [event, stream] = ApplicationSerializer.ApplicationSerializer.deserialize(stream, TypeCode.Int)
-            self.__events.append(event)
+        [self.__events, stream] = ApplicationSerializer.ApplicationSerializer.deserializeArray(stream, TypeCode.Int, numEvents)
         return stream
     
 class TlistDataS(object):
@@ -284,7 +282,7 @@ class TlistData(ListDataBase):
             (int)    The value
         """
         return ListDataBase.getDataSize(self) + len(self.__events)*4
-    def serializeData(self, stream=b''):
+    def serializeData(self, stream=None):
         """
         Description:
             Serializes all data contained in this instace into
@@ -294,11 +292,11 @@ class TlistData(ListDataBase):
         Returns:
             char[]    The stream containing the results
         """
-        stream += ListDataBase.serializeData(self)
-        stream += ApplicationSerializer.ApplicationSerializer.serialize(len(self.__events), objTypeCode=TypeCode.Int)
+        stream = ListDataBase.serializeData(self, stream)
+        stream = ApplicationSerializer.ApplicationSerializer.serialize(len(self.__events), stream, objTypeCode=TypeCode.Int)
         for event in self.__events:                    
-            stream += ApplicationSerializer.ApplicationSerializer.serialize(event.event, objTypeCode=TypeCode.Ushort)
-            stream += ApplicationSerializer.ApplicationSerializer.serialize(event.time, objTypeCode=TypeCode.Ushort)
+            stream = ApplicationSerializer.ApplicationSerializer.serialize(event.event, stream, objTypeCode=TypeCode.Ushort)
+            stream = ApplicationSerializer.ApplicationSerializer.serialize(event.time, stream, objTypeCode=TypeCode.Ushort)
         return stream
     def deserializeData(self, stream):
         """
@@ -318,7 +316,7 @@ class TlistData(ListDataBase):
         if (version != 0):
             raise DeviceErrorException(ListDataBase.DSA3K_UNSUPPORTED_LISTFORMAT)        
         [numEvents, stream] = ApplicationSerializer.ApplicationSerializer.deserialize(stream, TypeCode.Int)
-        for i in range(0, numEvents):
+        for _ in range(numEvents):
             [event, stream] = ApplicationSerializer.ApplicationSerializer.deserialize(stream, TypeCode.Ushort)
             [time, stream] = ApplicationSerializer.ApplicationSerializer.deserialize(stream, TypeCode.Ushort)
             self.__events.append(TlistDataS(event, time))
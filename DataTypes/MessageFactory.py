@@ -28,41 +28,63 @@ class MessageFactory(object):
         else:
             return False
     supportsMsgVersion = staticmethod(supportsMsgVersion)
-    def serializeToMessage(data):
+    def serializeToMessage(data, stream=None):
         """
         Description:
             This method serializes the data into a stream
         Arguments:
             data (in, SerializableObject)    The data to serialize
+            stream (in, out, bytearray)      The stream to append the message
+                                             to.  If not supplied, a new
+                                             stream is created
         Exceptions:
             UnsupportedTypeException        Data type is not supported
         Returns:
-            char[]    The stream
+            bytearray    The stream
         """
         if (isinstance(data, SerializableObject) is False):
             raise UnsupportedTypeException()
         
         #Serialize the data
         dataStream = ApplicationSerializer.ApplicationSerializer.serialize(data, writeMeta=True)
-        
+        return MessageFactory.serializeDataToMessage(dataStream, stream)
+    serializeToMessage = staticmethod(serializeToMessage)
+    def serializeDataToMessage(dataStream, stream=None):
+        """
+        Description:
+            This method signs already serialized data and
+            writes it as a message into a stream
+        Arguments:
+            dataStream (in, bytes)           The serialized data
+            stream (in, out, bytearray)      The stream to append the message
+                                             to.  If not supplied, a new
+                                             stream is created
+        Returns:
+            bytearray    The stream
+        """
         #Sign the data and serialize the signature
         DS = DigitalSignature(dataStream)
         DS.sign()
         dsStream = DS.serialize()
 
-        crc = ctypes.c_uint32(zlib.crc32(dsStream+dataStream)).value
+        #The CRC covers the signature followed by the data.  It is
+        #continued across both parts instead of joining them
+        crc = zlib.crc32(dataStream, zlib.crc32(dsStream)) & 0xFFFFFFFF
         
-        #Create the message header and serialize it
+        #Append the message header and then the parts
         msgHdr = MessageHeader(crc, len(dsStream)+len(dataStream))
-        hdrStream = msgHdr.serialize()
-        
-        #Return the entire message serialized (sum of all parts)
-        return hdrStream+dsStream+dataStream
-    serializeToMessage = staticmethod(serializeToMessage)
-    def deserializeFromMessage(stream):
+        if (None == stream):
+            stream = bytearray()
+        stream = msgHdr.serialize(stream)
+        stream += dsStream
+        stream += dataStream
+        return stream
+    serializeDataToMessage = staticmethod(serializeDataToMessage)
+    def getMessageData(stream):
         """
         Description:
-            This method serializes the data into a stream
+            This method verifies the message header, checksum and
+            signature and returns the serialized data that follows
         Arguments:
             stream (in, char[])    The message stream
         Exceptions:
@@ -70,7 +92,7 @@ class MessageFactory(object):
             ChecksumException
             DigitalSignatureException
         Returns:
-            [any, char[]]    [Data, the stream minus deserialized info]
+            memoryview    The serialized data
         """
         msgHdr = MessageHeader()
         stream = msgHdr.deserialize(stream)
@@ -84,6 +106,21 @@ class MessageFactory(object):
         ds = DigitalSignature()
         stream = ds.deserialize(stream)
         ds.verify()
-        
+        return memoryview(stream)
+    getMessageData = staticmethod(getMessageData)
+    def deserializeFromMessage(stream):
+        """
+        Description:
+            This method serializes the data into a stream
+        Arguments:
+            stream (in, char[])    The message stream
+        Exceptions:
+            MessageVersionException
+            ChecksumException
+            DigitalSignatureException
+        Returns:
+            [any, char[]]    [Data, the stream minus deserialized info]
+        """
+        stream = MessageFactory.getMessageData(stream)
         return ApplicationSerializer.ApplicationSerializer.deserialize(stream)
     deserializeFromMessage = staticmethod(deserializeFromMessage)
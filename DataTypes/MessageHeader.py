@@ -1,6 +1,8 @@
-import ApplicationSerializer
 from Serializable import Serializable
-from TypeCode import TypeCode
+import struct
+
+#Message header: size, version, sequence number and CRC (all Uint)
+_S_HEADER = struct.Struct("<IIII")
 
 class MessageHeader(Serializable):
     """
@@ -64,7 +66,7 @@ class MessageHeader(Serializable):
         self.__Version=1
         self.__SequenceNumber=0
         self.__CRC=crc
-    def serialize(self, stream=b''):
+    def serialize(self, stream=None):
         """
         Description:
             Serializes all contained data into a stream
@@ -73,10 +75,10 @@ class MessageHeader(Serializable):
         Returns:
             char[]    The serialized data
         """
-        stream += ApplicationSerializer.ApplicationSerializer.serialize(self.__Size, objTypeCode=TypeCode.Uint)
-        stream += ApplicationSerializer.ApplicationSerializer.serialize(self.__Version, objTypeCode=TypeCode.Uint)
-        stream += ApplicationSerializer.ApplicationSerializer.serialize(self.__SequenceNumber, objTypeCode=TypeCode.Uint)
-        stream += ApplicationSerializer.ApplicationSerializer.serialize(self.__CRC, objTypeCode=TypeCode.Uint)
+        if (None == stream):
+            stream = bytearray()
+        stream += _S_HEADER.pack(self.__Size & 0xFFFFFFFF, self.__Version & 0xFFFFFFFF,
+                                 self.__SequenceNumber & 0xFFFFFFFF, self.__CRC & 0xFFFFFFFF)
         return stream
     def deserialize(self, stream):
         """
@@ -87,10 +89,8 @@ class MessageHeader(Serializable):
         Returns:
             char[]    The serialized data minus the data
         """
-        [self.__Size, stream] = ApplicationSerializer.ApplicationSerializer.deserialize(stream, TypeCode.Uint)
-        [self.__Version, stream] = ApplicationSerializer.ApplicationSerializer.deserialize(stream, TypeCode.Uint)
-        [self.__SequenceNumber, stream] = ApplicationSerializer.ApplicationSerializer.deserialize(stream, TypeCode.Uint)
-        [self.__CRC, stream] = ApplicationSerializer.ApplicationSerializer.deserialize(stream, TypeCode.Uint)
-        return stream
+        stream = memoryview(stream)
+        [self.__Size, self.__Version, self.__SequenceNumber, self.__CRC] = _S_HEADER.unpack_from(stream, 0)
+        return stream[_S_HEADER.size:]
         
                         
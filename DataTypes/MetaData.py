@@ -1,6 +1,9 @@
 from Serializable import *
 import struct
 
+#Precompiled format for the (type, size) pair
+_S_ii = struct.Struct("<ii")
+
 class MetaData(Serializable):
     """
     Description:
@@ -37,7 +40,7 @@ class MetaData(Serializable):
             The value
         """ 
         return self.__size
-    def serialize(self, stream=b''):
+    def serialize(self, stream=None):
         """
         History:
             This method serializes the data contained
@@ -47,7 +50,9 @@ class MetaData(Serializable):
         Return:
             none
         """
-        stream += struct.pack("<ii", int(self.__type), int(self.__size))
+        if (None == stream):
+            stream = bytearray()
+        stream += _S_ii.pack(int(self.__type), int(self.__size))
         return stream
     def deserialize(self, stream):
         """
@@ -59,8 +64,7 @@ class MetaData(Serializable):
         Return:
             char[]    The stream minus the deserialized data
         """
-        v=stream[0:8]
-        data=struct.unpack("<ii", v)
+        data=_S_ii.unpack_from(stream, 0)
         self.__type = data[0]
         self.__size = data[1]
         stream=stream[8:]
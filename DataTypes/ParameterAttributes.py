@@ -262,22 +262,22 @@ class ParameterAttributes(SerializableObject):
         Returns:
             char[]    The stream containing the results
         """        
-        stream += ApplicationSerializer.ApplicationSerializer.serialize(self.__code, objTypeCode=TypeCode.Int)
-        stream += ApplicationSerializer.ApplicationSerializer.serialize(self.__attr, objTypeCode=TypeCode.Int)
-        stream += ApplicationSerializer.ApplicationSerializer.serialize(self.__paramDataType, objTypeCode=TypeCode.Int)
-        stream += ApplicationSerializer.ApplicationSerializer.serialize(len(self.__enum), objTypeCode=TypeCode.Int)
-        stream += ApplicationSerializer.ApplicationSerializer.serialize(self.__min, writeMeta=True)
-        stream += ApplicationSerializer.ApplicationSerializer.serialize(self.__max, writeMeta=True)
-        stream += ApplicationSerializer.ApplicationSerializer.serialize(self.__def, writeMeta=True)
-        stream += ApplicationSerializer.ApplicationSerializer.serialize(self.__description, writeMeta=True)
-        stream += ApplicationSerializer.ApplicationSerializer.serialize(self.__name, writeMeta=True)
-        stream += ApplicationSerializer.ApplicationSerializer.serialize(self.__step, writeMeta=True)       
+        stream = ApplicationSerializer.ApplicationSerializer.serialize(self.__code, stream, objTypeCode=TypeCode.Int)
+        stream = ApplicationSerializer.ApplicationSerializer.serialize(self.__attr, stream, objTypeCode=TypeCode.Int)
+        stream = ApplicationSerializer.ApplicationSerializer.serialize(self.__paramDataType, stream, objTypeCode=TypeCode.Int)
+        stream = ApplicationSerializer.ApplicationSerializer.serialize(len(self.__enum), stream, objTypeCode=TypeCode.Int)
+        stream = ApplicationSerializer.ApplicationSerializer.serialize(self.__min, stream, writeMeta=True)
+        stream = ApplicationSerializer.ApplicationSerializer.serialize(self.__max, stream, writeMeta=True)
+        stream = ApplicationSerializer.ApplicationSerializer.serialize(self.__def, stream, writeMeta=True)
+        stream = ApplicationSerializer.ApplicationSerializer.serialize(self.__description, stream, writeMeta=True)
+        stream = ApplicationSerializer.ApplicationSerializer.serialize(self.__name, stream, writeMeta=True)
+        stream = ApplicationSerializer.ApplicationSerializer.serialize(self.__step, stream, writeMeta=True)       
         for enum in self.__enum:
-             stream += ApplicationSerializer.ApplicationSerializer.serialize(enum, writeMeta=True)        
+             stream = ApplicationSerializer.ApplicationSerializer.serialize(enum, stream, writeMeta=True)        
         for enum in self.__enumAttributes:
-             stream += ApplicationSerializer.ApplicationSerializer.serialize(enum.getName(), writeMeta=True)
+             stream = ApplicationSerializer.ApplicationSerializer.serialize(enum.getName(), stream, writeMeta=True)
         for enum in self.__enumAttributes:
-             stream += ApplicationSerializer.ApplicationSerializer.serialize(enum.getNameId(), writeMeta=True)
+             stream = ApplicationSerializer.ApplicationSerializer.serialize(enum.getNameId(), stream, writeMeta=True)
         return stream
     def deserializeData(self, stream):
         """
@@ -302,18 +302,18 @@ class ParameterAttributes(SerializableObject):
         [self.__name, stream] = ApplicationSerializer.ApplicationSerializer.deserialize(stream)
         [self.__step, stream] = ApplicationSerializer.ApplicationSerializer.deserialize(stream) 
                         
-        for i in range(0, numEnums):
+        for _ in range(numEnums):
             [enum, stream] = ApplicationSerializer.ApplicationSerializer.deserialize(stream)
             self.__enum.append(enum)        
         names = []    
-        for i in range(0, numEnums):
+        for _ in range(numEnums):
             [n, stream] = ApplicationSerializer.ApplicationSerializer.deserialize(stream)
             names.append(n)
         ids = []    
-        for i in range(0, numEnums):
+        for _ in range(numEnums):
             [id, stream] = ApplicationSerializer.ApplicationSerializer.deserialize(stream)
             ids.append(id)        
-        for i in range(0, numEnums):
-            self.__enumAttributes.append(EnumerationValueAttributes(names[i], self.__enum[i], ids[i]))
+        for (n, enum, id) in zip(names, self.__enum, ids):
+            self.__enumAttributes.append(EnumerationValueAttributes(n, enum, id))
 
         return stream
@@ -103,9 +103,9 @@ class PhaData(SpectralData):
         Returns:
             char[]    The stream containing the results
         """
-        stream += ApplicationSerializer.ApplicationSerializer.serialize(long(self.__liveTime), objTypeCode=TypeCode.Long)
-        stream += ApplicationSerializer.ApplicationSerializer.serialize(long(self.__realTime), objTypeCode=TypeCode.Long)
-        stream += ApplicationSerializer.ApplicationSerializer.serialize(long(self.__compValue), objTypeCode=TypeCode.Long)
+        stream = ApplicationSerializer.ApplicationSerializer.serialize(long(self.__liveTime), stream, objTypeCode=TypeCode.Long)
+        stream = ApplicationSerializer.ApplicationSerializer.serialize(long(self.__realTime), stream, objTypeCode=TypeCode.Long)
+        stream = ApplicationSerializer.ApplicationSerializer.serialize(long(self.__compValue), stream, objTypeCode=TypeCode.Long)
         stream = SpectralData.serializeData(self, stream)
         return stream
 
@@ -125,11 +125,11 @@ class SCAbuffer(SerializableObject):
                 Returns:
                     char[]    The stream containing the results
                 """                
-                stream += ApplicationSerializer.ApplicationSerializer.serialize(self.__startTime, objTypeCode=TypeCode.DateTime)
-                stream += ApplicationSerializer.ApplicationSerializer.serialize(long(self.__elapsedReal), objTypeCode=TypeCode.Long)
-                stream += ApplicationSerializer.ApplicationSerializer.serialize(long(self.__elapsedLive), objTypeCode=TypeCode.Long)
-                stream += ApplicationSerializer.ApplicationSerializer.serialize(int(self.__flags), objTypeCode=TypeCode.Int)
-                stream += ApplicationSerializer.ApplicationSerializer.serialize(int(self.__spare), objTypeCode=TypeCode.Int)
+                stream = ApplicationSerializer.ApplicationSerializer.serialize(self.__startTime, stream, objTypeCode=TypeCode.DateTime)
+                stream = ApplicationSerializer.ApplicationSerializer.serialize(long(self.__elapsedReal), stream, objTypeCode=TypeCode.Long)
+                stream = ApplicationSerializer.ApplicationSerializer.serialize(long(self.__elapsedLive), stream, objTypeCode=TypeCode.Long)
+                stream = ApplicationSerializer.ApplicationSerializer.serialize(int(self.__flags), stream, objTypeCode=TypeCode.Int)
+                stream = ApplicationSerializer.ApplicationSerializer.serialize(int(self.__spare), stream, objTypeCode=TypeCode.Int)
                 return stream
             def deserializeData(self, stream):
                 """
@@ -223,8 +223,8 @@ class SCAbuffer(SerializableObject):
                 Returns:
                     char[]    The stream containing the results
                 """                
-                stream += ApplicationSerializer.ApplicationSerializer.serialize(self.__counts, objTypeCode=TypeCode.Int)
-                stream += ApplicationSerializer.ApplicationSerializer.serialize(self.__flags, objTypeCode=TypeCode.Int)                
+                stream = ApplicationSerializer.ApplicationSerializer.serialize(self.__counts, stream, objTypeCode=TypeCode.Int)
+                stream = ApplicationSerializer.ApplicationSerializer.serialize(self.__flags, stream, objTypeCode=TypeCode.Int)                
                 return stream
             def deserializeData(self, stream):
                 """
@@ -313,7 +313,7 @@ class SCAbuffer(SerializableObject):
                 char[]    The stream containing the results
             """        
             stream = self.__header.serializeData(stream)
-            stream += ApplicationSerializer.ApplicationSerializer.serialize(len(self.__data), objTypeCode=TypeCode.Int)
+            stream = ApplicationSerializer.ApplicationSerializer.serialize(len(self.__data), stream, objTypeCode=TypeCode.Int)
             for data in self.__data:              
                 stream = data.serializeData(stream)
             return stream
@@ -331,7 +331,7 @@ class SCAbuffer(SerializableObject):
             try:
                 stream = self.__header.deserializeData(stream)
                 [numEntries, stream] = ApplicationSerializer.ApplicationSerializer.deserialize(stream, TypeCode.Int)
-                for i in range(0, numEntries):
+                for _ in range(numEntries):
                     data = SCAbuffer.BufferEntry.SCAdata()
                     stream = data.deserializeData(stream)
                     self.__data.append(data)
@@ -408,9 +408,9 @@ class SCAbuffer(SerializableObject):
             Returns:
                 char[]    The stream containing the results
             """                
-            stream += ApplicationSerializer.ApplicationSerializer.serialize(self.__startTime, objTypeCode=TypeCode.DateTime)
-            stream += ApplicationSerializer.ApplicationSerializer.serialize(self.__flags, objTypeCode=TypeCode.Int)
-            stream += ApplicationSerializer.ApplicationSerializer.serialize(self.__bytesPerSample, objTypeCode=TypeCode.Int)
+            stream = ApplicationSerializer.ApplicationSerializer.serialize(self.__startTime, stream, objTypeCode=TypeCode.DateTime)
+            stream = ApplicationSerializer.ApplicationSerializer.serialize(self.__flags, stream, objTypeCode=TypeCode.Int)
+            stream = ApplicationSerializer.ApplicationSerializer.serialize(self.__bytesPerSample, stream, objTypeCode=TypeCode.Int)
             return stream
         def deserializeData(self, stream):
             """
@@ -503,7 +503,7 @@ class SCAbuffer(SerializableObject):
             char[]    The stream containing the results
         """        
         stream = self.__header.serializeData(stream)
-        stream += ApplicationSerializer.ApplicationSerializer.serialize(len(self.__entries), objTypeCode=TypeCode.Int)
+        stream = ApplicationSerializer.ApplicationSerializer.serialize(len(self.__entries), stream, objTypeCode=TypeCode.Int)
         for entry in self.__entries:              
             stream = entry.serializeData(stream)
         return stream
@@ -521,7 +521,7 @@ class SCAbuffer(SerializableObject):
         try:
             stream = self.__header.deserializeData(stream)
             [numEntries, stream] = ApplicationSerializer.ApplicationSerializer.deserialize(stream, TypeCode.Int)
-            for i in range(0, numEntries):
+            for _ in range(numEntries):
                 entry = SCAbuffer.BufferEntry()
                 stream = entry.deserializeData(stream)
                 self.__entries.append(entry)
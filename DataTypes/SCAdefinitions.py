@@ -130,10 +130,10 @@ class SCAdefinitions(SerializableObject):
         Returns:
             char[]    The stream containing the results
         """        
-        stream += ApplicationSerializer.ApplicationSerializer.serialize(len(self.__definitions), objTypeCode=TypeCode.Int)
+        stream = ApplicationSerializer.ApplicationSerializer.serialize(len(self.__definitions), stream, objTypeCode=TypeCode.Int)
         for defin in self.__definitions:              
-            stream += ApplicationSerializer.ApplicationSerializer.serialize(float(defin.getLLD()), objTypeCode=TypeCode.Float)
-            stream += ApplicationSerializer.ApplicationSerializer.serialize(float(defin.getULD()), objTypeCode=TypeCode.Float)
+            stream = ApplicationSerializer.ApplicationSerializer.serialize(float(defin.getLLD()), stream, objTypeCode=TypeCode.Float)
+            stream = ApplicationSerializer.ApplicationSerializer.serialize(float(defin.getULD()), stream, objTypeCode=TypeCode.Float)
         return stream
     def deserializeData(self, stream):
         """
@@ -147,7 +147,7 @@ class SCAdefinitions(SerializableObject):
         """
         self.__definitions = []
         [numOf, stream] = ApplicationSerializer.ApplicationSerializer.deserialize(stream, TypeCode.Int)
-        for i in range(0, numOf): 
+        for _ in range(numOf):
             [LLD, stream] = ApplicationSerializer.ApplicationSerializer.deserialize(stream, TypeCode.Float) 
             [ULD, stream] = ApplicationSerializer.ApplicationSerializer.deserialize(stream, TypeCode.Float) 
             self.__definitions.append(SCAdefinitions.Definition(LLD, ULD))
@@ -4,7 +4,8 @@ class Serializable(object):
         This is an abstract class used to define a
         common serialization interface
     """
-    def serialize(self, stream=b''):
+    __slots__ = ()
+    def serialize(self, stream=None):
         """
         Description:
             This method serializes the data contained
@@ -1,6 +1,7 @@
 from Serializable import Serializable
 
 class SerializableObject(Serializable):
+    __slots__ = ('__type',)
     def getDataSize(self): 
         """
         Description:
@@ -12,7 +13,7 @@ class SerializableObject(Serializable):
             int    Number of bytes
         """
         pass    
-    def serializeData(self, stream=b''):
+    def serializeData(self, stream=None):
         """
         Description:
             This method serializes the data contained
@@ -51,16 +52,19 @@ class SerializableObject(Serializable):
     """
     def __init__(self, type):
         self.__type=type
-    def serialize(self, stream=b''):
+    def serialize(self, stream=None):
         """
         Description:
             This method serializes the data contained
             in this instance into the stream
         Arguments:
-            stream    (in, char[]) The stream to receive the data
+            stream    (in, out, bytearray) The stream to receive the data.
+                      If not supplied, a new stream is created
         Return:
-            char []   The stream containing the data
+            bytearray The stream containing the data
         """
+        if (None == stream):
+            stream = bytearray()
         return self.serializeData(stream)
     def deserialize(self, stream):
         """
@@ -73,6 +77,20 @@ class SerializableObject(Serializable):
             char []   The stream minus the data
         """
         return self.deserializeData(stream)
+    def deserializeFrom(self, stream, offset):
+        """
+        Description:
+            This method deserializes the data contained
+            in the stream, starting at the offset, and places
+            it into this instance
+        Arguments:
+            stream    (in, memoryview) The stream containing the data
+            offset    (in, int) The offset of the data within the stream
+        Return:
+            int       The offset following the data
+        """
+        remaining = self.deserialize(stream[offset:])
+        return len(stream) - len(remaining)
     def getSize(self): 
         """
         Description:
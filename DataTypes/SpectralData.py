@@ -117,11 +117,11 @@ class SpectralData(SerializableObject):
         Returns:
             char[]    The stream containing the results
         """
-        stream += ApplicationSerializer.ApplicationSerializer.serialize(self.__startTime)
-        stream += ApplicationSerializer.ApplicationSerializer.serialize(int(self.__status), objTypeCode=TypeCode.Int)
-        stream += ApplicationSerializer.ApplicationSerializer.serialize(self.__input, objTypeCode=TypeCode.Short)
-        stream += ApplicationSerializer.ApplicationSerializer.serialize(self.__group, objTypeCode=TypeCode.Short)
-        stream += self.__spectrum.serialize()
+        stream = ApplicationSerializer.ApplicationSerializer.serialize(self.__startTime, stream)
+        stream = ApplicationSerializer.ApplicationSerializer.serialize(int(self.__status), stream, objTypeCode=TypeCode.Int)
+        stream = ApplicationSerializer.ApplicationSerializer.serialize(self.__input, stream, objTypeCode=TypeCode.Short)
+        stream = ApplicationSerializer.ApplicationSerializer.serialize(self.__group, stream, objTypeCode=TypeCode.Short)
+        stream = self.__spectrum.serialize(stream)
         return stream
     def deserializeData(self, stream):
         """
@@ -20,19 +20,25 @@ class Spectrum(SerializableObject):
         to a spectrum such as counts, number of channels, and encoding
         scheme.
     """
+    #When True and numpy is installed, received counts are returned as
+    #a little endian int32 numpy array viewing the received message
+    #instead of being copied into a list
+    countsAsNumpy = False
     def __init__(self, cnts=None):
         """
         Description:
             Initializes this instance.
         Arguments:
-            cnts (int[]) The counts
+            cnts (int[] or numpy.ndarray) The counts.  The sequence is
+                                          referenced, not copied
         Return:
             None
         """
         SerializableObject.__init__(self, TypeCode.SpectralData)
         self.__encoding = SpectrumEncodingType.EncodingNone
-        self.__numChannels = 0 if None == cnts else len(cnts)
-        self.__counts = [] if None == cnts else cnts
+        #Identity test so numpy arrays are not compared element-wise
+        self.__numChannels = 0 if cnts is None else len(cnts)
+        self.__counts = [] if cnts is None else cnts
     def getEncoding(self):
         """
         Description:
@@ -60,7 +66,7 @@ class Spectrum(SerializableObject):
         Arguments:
             none
         Return:
-            (int []) the value
+            (int [] or numpy.ndarray) the value
         """
         return self.__counts
     def getDataSize(self):
@@ -87,11 +93,10 @@ class Spectrum(SerializableObject):
         Returns:
             char[]    The stream containing the results
         """
-        stream += ApplicationSerializer.ApplicationSerializer.serialize(self.__encoding, objTypeCode=TypeCode.Int)
-        stream += ApplicationSerializer.ApplicationSerializer.serialize(self.__numChannels, objTypeCode=TypeCode.Int)
-        stream += ApplicationSerializer.ApplicationSerializer.serialize(len(self.__counts)*4, objTypeCode=TypeCode.Int)
-        for cnt in self.__counts:
-            stream += ApplicationSerializer.ApplicationSerializer.serialize(int(cnt), objTypeCode=TypeCode.Int)
+        stream = ApplicationSerializer.ApplicationSerializer.serialize(self.__encoding, stream, objTypeCode=TypeCode.Int)
+        stream = ApplicationSerializer.ApplicationSerializer.serialize(self.__numChannels, stream, objTypeCode=TypeCode.Int)
+        stream = ApplicationSerializer.ApplicationSerializer.serialize(len(self.__counts)*4, stream, objTypeCode=TypeCode.Int)
+        stream = ApplicationSerializer.ApplicationSerializer.serializeArray(stream, TypeCode.Int, self.__counts)
         return stream
 
     def deserializeData(self, stream):
@@ -104,11 +109,8 @@ class Spectrum(SerializableObject):
         Returns:
             char[]    The stream containing the results
         """
-       self.__counts = []
        [self.__encoding, stream] = ApplicationSerializer.ApplicationSerializer.deserialize(stream, TypeCode.Int)
        [self.__numChannels, stream] = ApplicationSerializer.ApplicationSerializer.deserialize(stream, TypeCode.Int)
        [numEncoded, stream] = ApplicationSerializer.ApplicationSerializer.deserialize(stream, TypeCode.Int)
-       for i in range(0, self.__numChannels):
-           [cnt, stream] = ApplicationSerializer.ApplicationSerializer.deserialize(stream, TypeCode.Int)
-           self.__counts.append(cnt)
+       [self.__counts, stream] = ApplicationSerializer.ApplicationSerializer.deserializeArray(stream, TypeCode.Int, self.__numChannels, Spectrum.countsAsNumpy)
        return stream
@@ -5,6 +5,15 @@ from Exceptions import AbortException, InvalidResponseException
 from ChannelBase import *
 from Command import Command, InternalCommandCodes
 import errno
+import struct
+
+#The Lynx sends streamed data on its own port so the stream cannot share
+#the configuration socket.  Nothing is sent on it so the send buffer is
+#kept small; the OS rounds this up to its minimum
+_STREAM_SEND_BUFFER_SIZE = 4096
+
+#Size (Int) that every message starts with
+_S_SIZE = struct.Struct("<i")
 
 class StreamChannel(ChannelBase):
     """
@@ -34,6 +43,7 @@ class StreamChannel(ChannelBase):
         """
         ChannelBase.__init__(self) 
         self.setPort(16386)
+        ChannelBase.setProperty(self, "sendbuffersize", _STREAM_SEND_BUFFER_SIZE)
         self.__enable = False        
         self.__abort = False
     def open(self, localAddr, devAddr):
@@ -106,8 +116,9 @@ class StreamChannel(ChannelBase):
         """
         try:
             stream=self.recv(4)
-            [msgSize, dum] = ApplicationSerializer.deserialize(stream, TypeCode.Int)
+            msgSize = _S_SIZE.unpack_from(stream, 0)[0]
             stream+=self.recv(msgSize-len(stream))
+            self.setQuickAck()
             [msg, stream] = MessageFactory.deserializeFromMessage(stream)                        
         except AbortException:
             self.close()
@@ -133,7 +144,8 @@ class StreamChannel(ChannelBase):
         Returns:
             none
         """        
-        name = name.lower()       
+        if (name.islower() is False):
+            name = name.lower()
         if (("enable" == name) or ("enablestreaming" == name) or ("usestream" == name)):
             self.__enable = val
         elif ("streamingport" == name):
@@ -152,7 +164,8 @@ class StreamChannel(ChannelBase):
         Returns:
             any                  The value
         """
-        name = name.lower()        
+        if (name.islower() is False):
+            name = name.lower()
         if (("enable" == name) or ("enablestreaming" == name) or ("usestream" == name)):
             return self.__enable
         elif ("streamingport" == name):
@@ -175,21 +188,26 @@ class StreamChannel(ChannelBase):
             nBytes (int)    The number of bytes to read
         Exceptions:
             AbortException  Raised when user sets the abort state
+            error           The connection was closed
         Returns:
-            (char [])       The data        
+            (bytearray)     The data        
         """
-        stream = b""
-        nBufBytes=len(stream)
+        stream = bytearray(nBytes)
+        view = memoryview(stream)
+        nBufBytes=0
         while(nBufBytes < nBytes):
+            nRead = None
             try:
                 if (self.__abort): 
                     raise AbortException()
-                stream += self.channel.recv(nBytes-nBufBytes)            
+                nRead = self.channel.recv_into(view[nBufBytes:], nBytes-nBufBytes)
             except error as msg:
                 if (errno.EWOULDBLOCK == error):
                     continue
-                
-            nBufBytes = len(stream)
+            if (0 == nRead):
+                raise error("The connection was closed by the device")
+            if (None != nRead):
+                nBufBytes += nRead
         return stream
     def send(self, stream):
         """
@@ -205,12 +223,13 @@ class StreamChannel(ChannelBase):
         Returns:
             int             The number of bytes sent
         """
-        bufSize=len(stream)
+        view = memoryview(stream)
+        bufSize=len(view)
         nBufBytes=0        
         while(nBufBytes != bufSize):
             try:
                 if (self.__abort): raise AbortException()
-                nBufBytes+=self.channel.send(stream[nBufBytes:])
+                nBufBytes+=self.channel.send(view[nBufBytes:])
             except error as msg:
                 if (errno.EWOULDBLOCK == error):
                     continue
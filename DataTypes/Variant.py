@@ -61,7 +61,7 @@ class Variant(Serializable):
         cnt = 4
         cnt += ApplicationSerializer.getTypeSize(self.__value)
         return cnt
-    def serialize(self, stream=b''):
+    def serialize(self, stream=None):
         """
         Description:
             Serializes all data contained in this instace into
@@ -71,6 +71,8 @@ class Variant(Serializable):
         Returns:
             char[]    The stream containing the results
         """
+        if (None == stream):
+            stream = bytearray()
         stream += struct.pack("i", ApplicationSerializer.getTypeSize(self.__value))
         stream += ApplicationSerializer.serialize(self.__value)
         return stream